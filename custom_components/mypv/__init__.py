@@ -5,13 +5,32 @@ import logging
 import voluptuous as vol
 
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_MONITORED_CONDITIONS
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_MONITORED_CONDITIONS,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 import homeassistant.helpers.config_validation as cv
 
-from .const import DATA_COORDINATOR, DOMAIN, PLATFORMS, SENSOR_TYPES
+from .const import (
+    DATA_CONTROLLER,
+    DATA_COORDINATOR,
+    DEFAULT_CONTROLLER_INTERVAL,
+    DEFAULT_CONTROLLER_KI,
+    DEFAULT_CONTROLLER_KP,
+    DEFAULT_CONTROLLER_MAX_POWER,
+    DEFAULT_CONTROLLER_TARGET,
+    DOMAIN,
+    PLATFORMS,
+    SENSOR_TYPES,
+)
+from .controller import SurplusController
 from .coordinator import MYPVDataUpdateCoordinator
+from .energy import async_remove_energy
+from .rollups import async_remove_rollups
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +54,7 @@ CONFIG_SCHEMA = vol.Schema(
 async def async_setup(hass: HomeAssistant, config):
     """Platform setup, do nothing."""
     hass.data.setdefault(DOMAIN, {})
+    async_setup_services(hass)
 
     if DOMAIN not in config:
         return True
@@ -56,6 +76,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         config=entry.data,
         options=entry.options,
     )
+    await coordinator.energy.async_load()
+    await coordinator.rollups.async_load()
     await coordinator.async_refresh()
 
     # Reload entry when its updated.
@@ -70,16 +92,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if entry.options.get("surplus_controller"):
+        controller = SurplusController(
+            hass,
+            coordinator,
+            entity_id=entry.options.get("controller_entity"),
+            target=entry.options.get("controller_target", DEFAULT_CONTROLLER_TARGET),
+            kp=entry.options.get("controller_kp", DEFAULT_CONTROLLER_KP),
+            ki=entry.options.get("controller_ki", DEFAULT_CONTROLLER_KI),
+            interval=entry.options.get(
+                "controller_interval", DEFAULT_CONTROLLER_INTERVAL
+            ),
+            max_power=entry.options.get(
+                "controller_max_power", DEFAULT_CONTROLLER_MAX_POWER
+            ),
+        )
+        controller.start()
+        hass.data[DOMAIN][entry.entry_id][DATA_CONTROLLER] = controller
+
+    async def _async_stop(event: Event) -> None:
+        """Release the heater and save the samples when Home Assistant stops.
+
+        Config entries are not unloaded on stop, so the queued archive
+        samples would be lost and the connection pool left open otherwise.
+        """
+        if controller := hass.data[DOMAIN][entry.entry_id].get(DATA_CONTROLLER):
+            await controller.async_stop()
+        await coordinator.async_shutdown()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    )
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    # release the heater while the connection pool is still open
+    if controller := hass.data[DOMAIN][entry.entry_id].get(DATA_CONTROLLER):
+        await controller.async_stop()
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored energy totals and rollups of a removed entry."""
+    await async_remove_energy(hass, entry.entry_id)
+    await async_remove_rollups(hass, entry.entry_id)
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,212 @@
+"""On-disk log of the samples of a MYPV device."""
+
+import asyncio
+import logging
+import math
+import mmap
+import os
+import struct
+import time as time_module
+
+from homeassistant.core import HomeAssistant
+
+from .const import ARCHIVE_BATCH_SIZE, ARCHIVE_FLUSH_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+# file header: magic, format version, length of the comma separated keys
+_HEADER = struct.Struct("<4sHH")
+_MAGIC = b"MYPV"
+_VERSION = 1
+_TIME = struct.Struct("<d")
+_SUFFIX = ".bin"
+
+
+def _record_format(keys: tuple[str, ...]) -> struct.Struct:
+    """Return the record layout: a double timestamp and a float per key."""
+    return struct.Struct(f"<d{len(keys)}f")
+
+
+def _start(path: str) -> float:
+    """Return the first timestamp of an archive file from its name."""
+    return float(os.path.basename(path).removesuffix(_SUFFIX))
+
+
+class SampleArchive:
+    """Append samples to fixed-size records in rotating files.
+
+    Every file starts with a header naming its keys followed by records of a
+    timestamp and one float per key, NaN standing for a missing value. The
+    files are named after their first timestamp, a new file is started once
+    the current one reaches max_file_size and files not written to within
+    the retention period are deleted. Samples are written in batches from
+    the executor and read through memory maps, so a range query only touches
+    the records it returns.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        directory: str,
+        keys: tuple[str, ...],
+        max_file_size: int,
+        retention: float,
+    ) -> None:
+        """Initialize the archive, retention is given in seconds."""
+        self.hass = hass
+        self.directory = directory
+        self.keys = tuple(keys)
+        self.max_file_size = max_file_size
+        self.retention = retention
+        self._header = self._build_header(self.keys)
+        self._record = _record_format(self.keys)
+        self._pending: list[bytes] = []
+        self._pending_since = 0.0
+        self._current: str | None = None
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _build_header(keys: tuple[str, ...]) -> bytes:
+        names = ",".join(keys).encode()
+        return _HEADER.pack(_MAGIC, _VERSION, len(names)) + names
+
+    def append(self, time: float, values: dict[str, float]) -> bool:
+        """Queue a sample and return True if the queued batch is due."""
+        if not self._pending:
+            self._pending_since = time
+        self._pending.append(
+            self._record.pack(time, *(values.get(key, math.nan) for key in self.keys))
+        )
+        return (
+            len(self._pending) >= ARCHIVE_BATCH_SIZE
+            or time - self._pending_since >= ARCHIVE_FLUSH_INTERVAL
+        )
+
+    async def async_flush(self) -> None:
+        """Write the queued samples."""
+        async with self._lock:
+            batch, self._pending = self._pending, []
+            if batch:
+                await self.hass.async_add_executor_job(self._write, batch)
+
+    def _files(self) -> list[str]:
+        """Return the paths of the archive files, oldest first."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(
+            (
+                os.path.join(self.directory, name)
+                for name in names
+                if name.endswith(_SUFFIX)
+            ),
+            key=_start,
+        )
+
+    def _write(self, batch: list[bytes]) -> None:
+        """Append a batch of records, rotating and expiring files."""
+        if self._current is None:
+            os.makedirs(self.directory, exist_ok=True)
+            files = self._files()
+            # continue the newest file if it was written with the same keys
+            if files and os.path.getsize(files[-1]) < self.max_file_size:
+                with open(files[-1], "rb") as file:
+                    if file.read(len(self._header)) == self._header:
+                        self._current = files[-1]
+        if self._current is None:
+            start = _TIME.unpack_from(batch[0])[0]
+            self._current = os.path.join(
+                self.directory, f"{math.floor(start)}{_SUFFIX}"
+            )
+            with open(self._current, "wb") as file:
+                file.write(self._header)
+        with open(self._current, "ab") as file:
+            file.write(b"".join(batch))
+            if file.tell() >= self.max_file_size:
+                self._current = None
+        self._expire()
+
+    def _expire(self) -> None:
+        """Delete the files not written to within the retention period."""
+        cutoff = time_module.time() - self.retention
+        for path in self._files():
+            if path != self._current and os.path.getmtime(path) < cutoff:
+                _LOGGER.debug("Removing expired sample file %s", path)
+                os.remove(path)
+
+    async def async_window(
+        self, keys: tuple[str, ...], start: float | None, end: float | None
+    ) -> dict[str, list]:
+        """Return the stored samples of the keys between start and end."""
+        await self.async_flush()
+        async with self._lock:
+            return await self.hass.async_add_executor_job(self._read, keys, start, end)
+
+    def _read(
+        self, keys: tuple[str, ...], start: float | None, end: float | None
+    ) -> dict[str, list]:
+        """Read the samples between start and end from the archive files."""
+        result: dict[str, list] = {"time": [], **{key: [] for key in keys}}
+        files = self._files()
+        for number, path in enumerate(files):
+            if end is not None and _start(path) > end:
+                break
+            if (
+                start is not None
+                and number + 1 < len(files)
+                and _start(files[number + 1]) < start
+            ):
+                # the next file starts before the window, so does this one end
+                continue
+            with (
+                open(path, "rb") as file,
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data,
+            ):
+                self._read_file(data, keys, start, end, result)
+        return result
+
+    @staticmethod
+    def _read_file(
+        data: mmap.mmap,
+        keys: tuple[str, ...],
+        start: float | None,
+        end: float | None,
+        result: dict[str, list],
+    ) -> None:
+        """Add the samples between start and end of one mapped file."""
+        magic, version, length = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            return
+        offset = _HEADER.size + length
+        file_keys = tuple(data[_HEADER.size : offset].decode().split(","))
+        record = _record_format(file_keys)
+        count = (len(data) - offset) // record.size
+
+        def time_at(position: int) -> float:
+            return _TIME.unpack_from(data, offset + position * record.size)[0]
+
+        def bisect(time: float) -> int:
+            low, high = 0, count
+            while low < high:
+                middle = (low + high) // 2
+                if time_at(middle) < time:
+                    low = middle + 1
+                else:
+                    high = middle
+            return low
+
+        first = 0 if start is None else bisect(start)
+        last = count if end is None else bisect(math.nextafter(end, math.inf))
+        columns = [
+            (key, file_keys.index(key) + 1 if key in file_keys else None)
+            for key in keys
+        ]
+        for position in range(first, last):
+            values = record.unpack_from(data, offset + position * record.size)
+            result["time"].append(values[0])
+            for key, column in columns:
+                value = None if column is None else values[column]
+                result[key].append(
+                    None if value is None or math.isnan(value) else value
+                )
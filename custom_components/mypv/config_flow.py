@@ -10,11 +10,37 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_DEVICE, CONF_HOST, CONF_MONITORED_CONDITIONS
 from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
+from homeassistant.helpers.selector import (
+    EntitySelector,
+    EntitySelectorConfig,
+    TextSelector,
+    TextSelectorConfig,
+)
 
-from .const import DOMAIN, MYPV_DEVICES, SENSOR_TYPES  # pylint:disable=unused-import
+from .const import (  # pylint:disable=unused-import
+    DEFAULT_ARCHIVE_RETENTION,
+    DEFAULT_CONTROLLER_INTERVAL,
+    DEFAULT_CONTROLLER_KI,
+    DEFAULT_CONTROLLER_KP,
+    DEFAULT_CONTROLLER_MAX_POWER,
+    DEFAULT_CONTROLLER_TARGET,
+    DEFAULT_HISTORY_KEYS,
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_INFO_INTERVAL,
+    DEFAULT_MAX_POLLING_INTERVAL,
+    DEFAULT_MAX_PUBLISH_AGE,
+    DEFAULT_MIN_POLLING_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_SETUP_INTERVAL,
+    DOMAIN,
+    MYPV_DEVICES,
+    SENSOR_TYPES,
+)
 
 SUPPORTED_SENSOR_TYPES = list(SENSOR_TYPES)
+HISTORY_SENSOR_TYPES = [
+    key for key, description in SENSOR_TYPES.items() if description.source == "data"
+]
 
 DEFAULT_HOST = "192.168.178.0"
 DEFAULT_DEVICE = "Unknown"
@@ -139,6 +165,26 @@ class MypvOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_MONITORED_CONDITIONS: user_input[CONF_MONITORED_CONDITIONS],
                     "use_all_sensors": user_input["use_all_sensors"],
                     "polling_interval": user_input["polling_interval"],
+                    "adaptive_polling": user_input["adaptive_polling"],
+                    "min_polling_interval": user_input["min_polling_interval"],
+                    "max_polling_interval": user_input["max_polling_interval"],
+                    "setup_interval": user_input["setup_interval"],
+                    "info_interval": user_input["info_interval"],
+                    "deadband_filter": user_input["deadband_filter"],
+                    "min_publish_interval": user_input["min_publish_interval"],
+                    "max_publish_age": user_input["max_publish_age"],
+                    "history_size": user_input["history_size"],
+                    "history_keys": user_input["history_keys"],
+                    "archive_history": user_input["archive_history"],
+                    "archive_retention": user_input["archive_retention"],
+                    "optimistic_switches": user_input["optimistic_switches"],
+                    "surplus_controller": user_input["surplus_controller"],
+                    "controller_entity": user_input.get("controller_entity"),
+                    "controller_target": user_input["controller_target"],
+                    "controller_kp": user_input["controller_kp"],
+                    "controller_ki": user_input["controller_ki"],
+                    "controller_interval": user_input["controller_interval"],
+                    "controller_max_power": user_input["controller_max_power"],
                 },
             )
 
@@ -148,6 +194,118 @@ class MypvOptionsFlowHandler(config_entries.OptionsFlow):
                     "polling_interval",
                     default=self.config_entry.options.get("polling_interval", 10),
                 ): int,
+                vol.Optional(
+                    "adaptive_polling",
+                    default=self.config_entry.options.get("adaptive_polling", False),
+                ): bool,
+                vol.Required(
+                    "min_polling_interval",
+                    default=self.config_entry.options.get(
+                        "min_polling_interval", DEFAULT_MIN_POLLING_INTERVAL
+                    ),
+                ): int,
+                vol.Required(
+                    "max_polling_interval",
+                    default=self.config_entry.options.get(
+                        "max_polling_interval", DEFAULT_MAX_POLLING_INTERVAL
+                    ),
+                ): int,
+                vol.Required(
+                    "setup_interval",
+                    default=self.config_entry.options.get(
+                        "setup_interval", DEFAULT_SETUP_INTERVAL
+                    ),
+                ): int,
+                vol.Required(
+                    "info_interval",
+                    default=self.config_entry.options.get(
+                        "info_interval", DEFAULT_INFO_INTERVAL
+                    ),
+                ): int,
+                vol.Optional(
+                    "deadband_filter",
+                    default=self.config_entry.options.get("deadband_filter", False),
+                ): bool,
+                vol.Required(
+                    "min_publish_interval",
+                    default=self.config_entry.options.get(
+                        "min_publish_interval", DEFAULT_MIN_PUBLISH_INTERVAL
+                    ),
+                ): int,
+                vol.Required(
+                    "max_publish_age",
+                    default=self.config_entry.options.get(
+                        "max_publish_age", DEFAULT_MAX_PUBLISH_AGE
+                    ),
+                ): int,
+                vol.Required(
+                    "history_size",
+                    default=self.config_entry.options.get(
+                        "history_size", DEFAULT_HISTORY_SIZE
+                    ),
+                ): int,
+                vol.Required(
+                    "history_keys",
+                    default=self.config_entry.options.get(
+                        "history_keys", DEFAULT_HISTORY_KEYS
+                    ),
+                ): cv.multi_select(HISTORY_SENSOR_TYPES),
+                vol.Optional(
+                    "archive_history",
+                    default=self.config_entry.options.get("archive_history", False),
+                ): bool,
+                vol.Required(
+                    "archive_retention",
+                    default=self.config_entry.options.get(
+                        "archive_retention", DEFAULT_ARCHIVE_RETENTION
+                    ),
+                ): int,
+                vol.Optional(
+                    "optimistic_switches",
+                    default=self.config_entry.options.get("optimistic_switches", False),
+                ): bool,
+                vol.Optional(
+                    "surplus_controller",
+                    default=self.config_entry.options.get("surplus_controller", False),
+                ): bool,
+                vol.Optional(
+                    "controller_entity",
+                    description={
+                        "suggested_value": self.config_entry.options.get(
+                            "controller_entity"
+                        )
+                    },
+                ): EntitySelector(EntitySelectorConfig(domain="sensor")),
+                vol.Required(
+                    "controller_target",
+                    default=self.config_entry.options.get(
+                        "controller_target", DEFAULT_CONTROLLER_TARGET
+                    ),
+                ): int,
+                vol.Required(
+                    "controller_kp",
+                    default=self.config_entry.options.get(
+                        "controller_kp", DEFAULT_CONTROLLER_KP
+                    ),
+                ): vol.Coerce(float),
+                vol.Required(
+                    "controller_ki",
+                    default=self.config_entry.options.get(
+                        "controller_ki", DEFAULT_CONTROLLER_KI
+                    ),
+                ): vol.Coerce(float),
+                vol.Required(
+                    "controller_interval",
+                    default=self.config_entry.options.get(
+                        "controller_interval", DEFAULT_CONTROLLER_INTERVAL
+                    ),
+                ): vol.Coerce(float),
+                vol.Required(
+                    "controller_max_power",
+                    default=self.config_entry.options.get(
+                        "controller_max_power", DEFAULT_CONTROLLER_MAX_POWER
+                    ),
+                ): int,
                 vol.Optional(
                     "use_all_sensors",
                     default=self.config_entry.options.get("use_all_sensors", False),
@@ -0,0 +1,136 @@
+"""Keep-alive HTTP connection pool for a single MYPV device."""
+
+from dataclasses import dataclass
+import logging
+from types import SimpleNamespace
+
+import aiohttp
+
+from homeassistant.const import __version__ as HA_VERSION
+
+from .const import DEFAULT_PAGE_TIMEOUT, KEEPALIVE_TIMEOUT, MAX_PARALLEL_REQUESTS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolStatistics:
+    """Connection usage counters of a device pool."""
+
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    stale_retries: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Return the share of requests served by a reused connection."""
+        total = self.connections_created + self.connections_reused
+        if not total:
+            return 0.0
+        return self.connections_reused / total
+
+
+class MYPVConnectionPool:
+    """Bounded pool of keep-alive connections to the web server of one device.
+
+    The embedded web server only handles a few sockets at once, so the pool
+    never opens more than MAX_PARALLEL_REQUESTS connections; further requests
+    wait for a free connection instead of opening new ones.
+    """
+
+    def __init__(self, host: str) -> None:
+        """Initialize the pool, the session is created on first use."""
+        self.host = host
+        self.statistics = PoolStatistics()
+        self._session: aiohttp.ClientSession | None = None
+        self._closed = False
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the session with a connector dedicated to this device."""
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_connection_create_end.append(self._on_connection_create_end)
+        trace.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=MAX_PARALLEL_REQUESTS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ),
+            headers={"User-Agent": f"HomeAssistant/{HA_VERSION} mypv"},
+            trace_configs=[trace],
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the pooled session of the device.
+
+        ClientConnectionError is raised once the pool is closed, so a late
+        request does not open a session nobody closes.
+        """
+        if self._closed:
+            raise aiohttp.ClientConnectionError(
+                f"Connection pool of {self.host} closed"
+            )
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    async def async_get(
+        self,
+        page: str,
+        params: dict | None = None,
+        timeout: tuple[float, float] = DEFAULT_PAGE_TIMEOUT,
+        extension: str = "jsn",
+    ) -> bytes:
+        """Request a page and return the raw body.
+
+        A keep-alive connection may have been closed by the device since its
+        last use; such a request is retried once on a fresh connection.
+        """
+        connect, read = timeout
+        client_timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        url = f"http://{self.host}/{page}.{extension}"
+        try:
+            async with self.session.get(
+                url, params=params, timeout=client_timeout
+            ) as response:
+                return await response.read()
+        except aiohttp.ServerDisconnectedError:
+            self.statistics.stale_retries += 1
+            async with self.session.get(
+                url, params=params, timeout=client_timeout
+            ) as response:
+                return await response.read()
+
+    async def async_close(self) -> None:
+        """Close all pooled connections, the pool is not used afterwards."""
+        self._closed = True
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        _LOGGER.debug("Connection pool of %s closed: %s", self.host, self.statistics)
+
+    async def _on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        self.statistics.requests += 1
+
+    async def _on_connection_create_end(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        self.statistics.connections_created += 1
+
+    async def _on_connection_reuseconn(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionReuseconnParams,
+    ) -> None:
+        self.statistics.connections_reused += 1
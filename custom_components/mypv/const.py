@@ -6,8 +6,10 @@ from datetime import timedelta
 from homeassistant.const import (
     PERCENTAGE,
     Platform,
+    UnitOfApparentPower,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
+    UnitOfEnergy,
     UnitOfFrequency,
     UnitOfPower,
     UnitOfTemperature,
@@ -19,14 +21,33 @@ DOMAIN = "mypv"
 PLATFORMS = [Platform.SENSOR, Platform.SWITCH]
 
 DATA_COORDINATOR = "coordinator"
+DATA_CONTROLLER = "controller"
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=10)
 
+# parallel page requests the embedded web server of a device can handle,
+# this is also the size of the keep-alive connection pool per device
+MAX_PARALLEL_REQUESTS = 2
+
+# seconds an idle pooled connection is kept open
+KEEPALIVE_TIMEOUT = 15
+
+# overall deadline of one refresh in seconds
+REFRESH_TIMEOUT = 4
+
+# page: (connect timeout, read timeout) in seconds
+PAGE_TIMEOUTS = {
+    "data": (2, 2),
+    "setup": (2, 3),
+    "mypv_dev": (2, 3),
+}
+DEFAULT_PAGE_TIMEOUT = (2, 3)
+
 # short name . long name
 MYPV_DEVICES = {
     "AC ELWA-E": "elwa",
     "AC-THOR": "acthor",
-    "AC-THOR 9s": "actor9s",
+    "AC-THOR 9s": "acthor9s",
     "AC ELWA 2": "elwa2",
     "dc_elwa": "dc_elwa",
     "Wi-Fi Meter": "meter",
@@ -36,6 +57,130 @@ MYPV_DEVICES = {
     "AC-THOR32": "acthor32",
     "AC-THOR32 9s": "acthor329s",
 }
+# status values per device short name in which the heater is idle
+# (standby, heating finished, no communication / disabled, blocked)
+IDLE_STATES = {
+    "elwa": {3, 5, 21, 22},
+    "acthor": {0, 3, 4, 6},
+    "acthor9s": {0, 3, 4, 6},
+    "elwa2": {0, 3, 4, 6},
+}
+
+# adaptive polling: fields watched and the change in watt between two polls
+# that switches to the minimum interval
+ADAPTIVE_SIGNALS = ("power", "power_solar", "surplus")
+ADAPTIVE_CHANGE_THRESHOLD = 100
+DEFAULT_POLLING_INTERVAL = 10
+DEFAULT_MIN_POLLING_INTERVAL = 2
+DEFAULT_MAX_POLLING_INTERVAL = 300
+
+# refresh interval in seconds of the pages besides data.jsn, 0 means the page
+# is only fetched on demand (first refresh, reconnect or explicit request)
+DEFAULT_SETUP_INTERVAL = 120
+DEFAULT_INFO_INTERVAL = 86400
+FIRMWARE_INTERVAL = 7 * 86400
+
+# clock fields of data.jsn which change on every poll, a payload that differs
+# only in these counts as unchanged
+VOLATILE_FIELDS = ("date", "loctime", "unixtime")
+
+# sensors computed from several data.jsn fields: sensor -> fields
+DERIVED_SENSORS = {
+    "power_act": ("power_act", "rel1_out", "load_nom"),
+}
+
+# per-phase values the derived three-phase metrics are computed from, per
+# device short name reporting all three phases of a quantity
+PHASE_KEYS = {
+    "heathorIot9": {
+        "volt": ("volt_mains_L1", "volt_mains_L2", "volt_mains_L3"),
+        "curr": ("curr_L1", "curr_L2", "curr_L3"),
+        "power": ("power_L1", "power_L2", "power_L3"),
+    },
+    "acthor9s": {
+        "volt": ("volt_mains", "volt_L2", "volt_L3"),
+        "curr": ("curr_mains", "curr_L2", "curr_L3"),
+    },
+}
+METER_PHASES = {
+    f"m{meter}": (f"m{meter}l1", f"m{meter}l2", f"m{meter}l3") for meter in range(5)
+}
+
+# raw codes of the status sensor per device short name, their texts are
+# the entity state translations in translations/*.json
+STATUS_CODES = {
+    "elwa": (1, 2, 3, 4, 5, 9, 20, 21, 22, 201, 202, 203, 204, 205, 209),
+    "acthor": (0, 1, 2, 3, 4, 5, 6),
+    "acthor9s": (0, 1, 2, 3, 4, 5, 6),
+    "elwa2": (0, 1, 2, 3, 4, 5, 6),
+}
+
+# raw codes of the other enum sensors
+ENUM_CODES = {
+    "cloudstate": (0, 1, 2, 3, 4, 5, 6, 99),
+    # websetup texts info_ps_state_txt1..4
+    "ps_state": (1, 2, 3, 4),
+}
+
+# energy sensor: power sensor it integrates
+ENERGY_SOURCES = {
+    "energy": "power",
+    "energy_solar": "power_solar",
+    "energy_grid": "power_grid",
+    "energy_act": "power_act",
+}
+# seconds between two samples above which the interval is not integrated
+ENERGY_MAX_GAP = 600
+# kWh steps in which the energy sensors are published
+ENERGY_PUBLISH_STEP = 0.01
+
+# data.jsn values kept in the in-memory sample buffer by default
+DEFAULT_HISTORY_KEYS = [
+    "power",
+    "power_act",
+    "power_solar",
+    "power_grid",
+    "surplus",
+    "m0sum",
+    "temp1",
+]
+# samples kept per device, 0 disables the buffer
+DEFAULT_HISTORY_SIZE = 3600
+
+# on-disk sample archive: samples written per batch, seconds a sample is
+# queued at most, size at which a new file is started and days kept
+ARCHIVE_BATCH_SIZE = 60
+ARCHIVE_FLUSH_INTERVAL = 60
+ARCHIVE_FILE_SIZE = 4 * 1024 * 1024
+DEFAULT_ARCHIVE_RETENTION = 28
+
+# rollup tiers of the buffered values: (bucket seconds, buckets kept), which
+# keep 1-minute buckets for a day, 15-minute buckets for two weeks and hourly
+# buckets for a year
+ROLLUP_TIERS = ((60, 1440), (900, 1344), (3600, 8760))
+
+# seconds setup.jsn parameter changes are collected into one request
+WRITE_COALESCE_WINDOW = 0.1
+# seconds an optimistic switch state waits for the confirming setup page
+WRITE_CONFIRM_TIMEOUT = 5
+# seconds parameter changes of the services are debounced to their latest value
+WRITE_DEBOUNCE = 1
+
+# service: setup.jsn parameter it writes, named after the websetup fields
+SERVICE_PARAMETERS = {
+    "set_max_power": "maxpw",
+    "switch_boost": "bstmode",
+    "set_control_target": "ptarget",
+}
+
+# surplus controller: grid power target in watt (negative = feed-in), gains
+# of the PI loop (ki per second), seconds between setpoints, power limit
+DEFAULT_CONTROLLER_TARGET = -50
+DEFAULT_CONTROLLER_KP = 0.5
+DEFAULT_CONTROLLER_KI = 0.1
+DEFAULT_CONTROLLER_INTERVAL = 1
+DEFAULT_CONTROLLER_MAX_POWER = 3000
+
 # short name
 MYPV_SWITCHES = [
     "devmode",
@@ -45,6 +190,24 @@ MYPV_SWITCHES = [
 ]
 
 
+# how often a sensor value changes: static values (versions, network setup)
+# and slow values are diagnostic and only published on their own schedule
+UPDATE_STATIC = "static"
+UPDATE_SLOW = "slow"
+UPDATE_LIVE = "live"
+
+# seconds between publishing the static and slow values
+UPDATE_INTERVALS = {
+    UPDATE_SLOW: 300,
+    UPDATE_STATIC: 86400,
+}
+
+# deadband filter: seconds between two published values and the age after
+# which a held back value is published anyway
+DEFAULT_MIN_PUBLISH_INTERVAL = 0
+DEFAULT_MAX_PUBLISH_AGE = 300
+
+
 @dataclass
 class S:
     """Sensor description with metadata for MYPV integration."""
@@ -54,15 +217,24 @@ class S:
     icon: str = ""
     device: str = ""
     source: str = "data"
+    update: str = UPDATE_LIVE
+    # changes up to deadband (in the sensor unit) or deadband_rel times the
+    # value are not published when the deadband filter is enabled
+    deadband: float = 0
+    deadband_rel: float = 0
 
 
 # sensor_type: [name, unit, icon, page, devices]
 SENSOR_TYPES = {
-    "device": S("Device", device="elwa"),
+    "device": S("Device", device="elwa", update=UPDATE_STATIC),
     "acthor9s": S("Acthor 9s"),
-    "fwversion": S("Firmware Version", icon="mdi:numeric", device="elwa"),
-    "psversion": S("Power Supply Version", icon="mdi:numeric"),
-    "p9sversion": S("Power Supply Version Acthor 9", icon="mdi:numeric"),
+    "fwversion": S(
+        "Firmware Version", icon="mdi:numeric", device="elwa", update=UPDATE_STATIC
+    ),
+    "psversion": S("Power Supply Version", icon="mdi:numeric", update=UPDATE_STATIC),
+    "p9sversion": S(
+        "Power Supply Version Acthor 9", icon="mdi:numeric", update=UPDATE_STATIC
+    ),
     "screen_mode_flag": S("Screen Mode"),
     "status": S(
         "Status ID",
@@ -151,7 +323,10 @@ SENSOR_TYPES = {
     ),
     "load_state": S("load_state", device="acthor acthor9s acthor32 acthor329s"),
     "load_nom": S(
-        "load_nom", UnitOfPower.WATT, device="acthor acthor9s acthor32 acthor329"
+        "load_nom",
+        UnitOfPower.WATT,
+        device="acthor acthor9s acthor32 acthor329",
+        update=UPDATE_STATIC,
     ),
     "rel1_out": S(
         "rel1_out",
@@ -199,10 +374,13 @@ SENSOR_TYPES = {
         UnitOfTime.DAYS,
         "mdi:bacteria",
         device="elwa acthor acthor9s acthor32 acthor329s elwa2 heathorIot35 heathorIot9",
+        update=UPDATE_SLOW,
+    ),
+    "date": S("Date", icon="mdi:calendar-today", update=UPDATE_SLOW),
+    "loctime": S(
+        "Lokale Uhrzeit", icon="mdi:home-clock", device="elwa", update=UPDATE_SLOW
     ),
-    "date": S("Date", icon="mdi:calendar-today"),
-    "loctime": S("Lokale Uhrzeit", icon="mdi:home-clock", device="elwa"),
-    "unixtime": S("Unix time", icon="mdi:web-clock", device="elwa"),
+    "unixtime": S("Unix time", icon="mdi:web-clock", device="elwa", update=UPDATE_SLOW),
     "wp_flag": S("wp_flag"),
     "wp_time1_ctr": S("wp_time1_ctr"),
     "wp_time2_ctr": S("wp_time2_ctr"),
@@ -219,28 +397,54 @@ SENSOR_TYPES = {
         "Block active", device="acthor acthor9s acthor32 acthor329s elwa elwa2 dc_elwa"
     ),
     "error_state": S("Error state", icon="mdi:alert-circle"),
-    "meter1_id": S("my-PV Meter 1 ID", icon="mdi:identifier", device="elwa"),
-    "meter1_ip": S("my-PV Meter 1 IP", icon="mdi:ip-network", device="elwa"),
-    "meter2_id": S("my-PV Meter 2 ID", icon="mdi:identifier", device="elwa"),
-    "meter2_ip": S("my-PV Meter 2 IP", icon="mdi:ip-network", device="elwa"),
-    "meter3_id": S("my-PV Meter 3 ID", icon="mdi:identifier", device="elwa"),
-    "meter3_ip": S("my-PV Meter 3 IP", icon="mdi:ip-network", device="elwa"),
-    "meter4_id": S("my-PV Meter 4 ID", icon="mdi:identifier", device="elwa"),
-    "meter4_ip": S("my-PV Meter 4 IP", icon="mdi:ip-network", device="elwa"),
-    "meter5_id": S("my-PV Meter 5 ID", icon="mdi:identifier", device="elwa"),
-    "meter5_ip": S("my-PV Meter 5 IP", icon="mdi:ip-network", device="elwa"),
-    "meter6_id": S("my-PV Meter 6 ID", icon="mdi:identifier", device="elwa"),
-    "meter6_ip": S("my-PV Meter 6 IP", icon="mdi:ip-network", device="elwa"),
+    "meter1_id": S(
+        "my-PV Meter 1 ID", icon="mdi:identifier", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter1_ip": S(
+        "my-PV Meter 1 IP", icon="mdi:ip-network", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter2_id": S(
+        "my-PV Meter 2 ID", icon="mdi:identifier", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter2_ip": S(
+        "my-PV Meter 2 IP", icon="mdi:ip-network", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter3_id": S(
+        "my-PV Meter 3 ID", icon="mdi:identifier", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter3_ip": S(
+        "my-PV Meter 3 IP", icon="mdi:ip-network", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter4_id": S(
+        "my-PV Meter 4 ID", icon="mdi:identifier", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter4_ip": S(
+        "my-PV Meter 4 IP", icon="mdi:ip-network", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter5_id": S(
+        "my-PV Meter 5 ID", icon="mdi:identifier", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter5_ip": S(
+        "my-PV Meter 5 IP", icon="mdi:ip-network", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter6_id": S(
+        "my-PV Meter 6 ID", icon="mdi:identifier", device="elwa", update=UPDATE_STATIC
+    ),
+    "meter6_ip": S(
+        "my-PV Meter 6 IP", icon="mdi:ip-network", device="elwa", update=UPDATE_STATIC
+    ),
     "meter_ss": S(
         "WiFi Meter Signalstärke",
         PERCENTAGE,
         "mdi:wifi",
         device="elwa elwa_min00205 acthor acthor_min00208 acthor9s acthor9s_min00208 elwa2",
+        update=UPDATE_SLOW,
     ),
     "meter_ssid": S(
         "WiFi Meter SSID",
         icon="mdi:wifi-marker",
         device="elwa elwa_min00205 acthor acthor_min00208 acthor9s acthor9s_min00208 elwa2",
+        update=UPDATE_STATIC,
     ),
     "surplus": S(
         "Meter + Batterieladeleistung",
@@ -328,112 +532,148 @@ SENSOR_TYPES = {
     "mss11": S(
         "Sekundärregler 11 Status", device="acthor acthor9s acthor32 acthor329s elwa2"
     ),
-    "tempchip": S("tempchip", UnitOfTemperature.CELSIUS, "mdi:chip", device="elwa"),
+    "tempchip": S(
+        "tempchip", UnitOfTemperature.CELSIUS, "mdi:chip", device="elwa", deadband=1
+    ),
     "volt_mains": S(
         "Eingangsspannung Leistungsteil L1",
         UnitOfElectricPotential.VOLT,
         "mdi:flash-triangle",
         device="acthor acthor9s acthor32 acthor329s elwa2 solthor",
+        deadband=1,
     ),
     "curr_mains": S(
         "Netzstrom L1",
         UnitOfElectricCurrent.AMPERE,
         "mdi:current-ac",
         device="acthor acthor9s acthor32 acthor329s solthor",
+        deadband=0.1,
     ),
     "volt_mains_L1": S(
         "Eingangsspannung Leistungsteil L1",
         UnitOfElectricPotential.VOLT,
         "mdi:flash-triangle",
         device="acthor acthor9s acthor32 acthor329s elwa2 solthor",
+        deadband=1,
     ),
     "curr_L1": S(
         "Current L1",
         UnitOfElectricCurrent.AMPERE,
         "mdi:current-ac",
         device="heathorIot35 heathorIot9",
+        deadband=0.1,
     ),
     "volt_mains_L2": S(
         "Eingangsspannung Leistungsteil L2",
         UnitOfElectricPotential.VOLT,
         "mdi:flash-triangle",
         device="heathorIot9",
+        deadband=1,
     ),
     "volt_L2": S(
         "Eingangsspannung Leistungsteil L2",
         UnitOfElectricPotential.VOLT,
         "mdi:flash-triangle",
         device="acthor9s",
+        deadband=1,
     ),
     "curr_L2": S(
         "Current L2",
         UnitOfElectricCurrent.AMPERE,
         "mdi:current-ac",
         device="heathorIot9 acthor9s",
+        deadband=0.1,
     ),
     "volt_mains_L3": S(
         "Eingangsspannung Leistungsteil L3",
         UnitOfElectricPotential.VOLT,
         "mdi:flash-triangle",
         device="heathorIot9",
+        deadband=1,
     ),
     "volt_L3": S(
         "Eingangsspannung Leistungsteil L3",
         UnitOfElectricPotential.VOLT,
         "mdi:flash-triangle",
         device="acthor9s",
+        deadband=1,
     ),
     "curr_L3": S(
         "Current L3",
         UnitOfElectricCurrent.AMPERE,
         "mdi:current-ac",
         device="heathorIot9 acthor9s",
+        deadband=0.1,
     ),
     "volt_out": S(
         "Ausgangsspannung Leistungsteil",
         UnitOfElectricPotential.VOLT,
         "mdi:flash-triangle",
         device="acthor acthor9s acthor32 acthor329s",
+        deadband=1,
     ),
     "volt_aux": S(
         "Spannung L2 an AUX-Relais",
         UnitOfElectricPotential.VOLT,
         "mdi:flash-triangle",
         device="elwa2",
+        deadband=1,
     ),
     "freq": S(
         "Netzfrequenz",
         UnitOfFrequency.HERTZ,
         "mdi:sine-wave",
         device="acthor acthor9s acthor32 acthor329s elwa2 solthor heathorIot35 heathorIot9",
+        deadband=0.02,
     ),
     "temp_ps": S(
         "Temperatur Leistungsteil",
         UnitOfTemperature.CELSIUS,
         "mdi:thermometer",
         device="acthor acthor9s acthor32 acthor329s elwa2 solthor heathorIot35 heathorIot9",
+        deadband=0.1,
     ),
     "fan_speed": S(
         "Lüfterstufe",
         icon="mdi:fan",
         device="acthor acthor9s acthor32 acthor329s elwa2",
+        update=UPDATE_SLOW,
     ),
     "ps_state": S(
         "Status Leistungsteil", device="acthor acthor9s acthor32 acthor329s elwa2"
     ),
     "relay_boost": S("Relais Boost", device="solthor"),
     "relay_alarm": S("Relais Alarm", device="solthor"),
-    "cur_ip": S("Current IP", icon="mdi:ip-network", device="elwa"),
-    "cur_sn": S("Current subnet mask", icon="mdi:numeric", device="elwa"),
-    "cur_gw": S("Current gateway", icon="mdi:router-network", device="elwa"),
-    "cur_dns": S("Current DNS", icon="mdi:dns", device="elwa"),
-    "fwversionlatest": S("latest Firmware version", icon="mdi:numeric"),
-    "psversionlatest": S("latest Power supply version", icon="mdi:numeric"),
-    "p9sversionlatest": S("latest Power supply version Acthor 9", icon="mdi:numeric"),
-    "upd_state": S("Update state", icon="mdi:update"),
-    "upd_files_left": S("Update files left", icon="mdi:update"),
-    "ps_upd_state": S("Power supply update state", icon="mdi:update"),
-    "p9s_upd_state": S("Acthor 9 Power supply update state", icon="mdi:update"),
+    "cur_ip": S(
+        "Current IP", icon="mdi:ip-network", device="elwa", update=UPDATE_STATIC
+    ),
+    "cur_sn": S(
+        "Current subnet mask", icon="mdi:numeric", device="elwa", update=UPDATE_STATIC
+    ),
+    "cur_gw": S(
+        "Current gateway",
+        icon="mdi:router-network",
+        device="elwa",
+        update=UPDATE_STATIC,
+    ),
+    "cur_dns": S("Current DNS", icon="mdi:dns", device="elwa", update=UPDATE_STATIC),
+    "fwversionlatest": S(
+        "latest Firmware version", icon="mdi:numeric", update=UPDATE_STATIC
+    ),
+    "psversionlatest": S(
+        "latest Power supply version", icon="mdi:numeric", update=UPDATE_STATIC
+    ),
+    "p9sversionlatest": S(
+        "latest Power supply version Acthor 9", icon="mdi:numeric", update=UPDATE_STATIC
+    ),
+    "upd_state": S("Update state", icon="mdi:update", update=UPDATE_SLOW),
+    "upd_files_left": S("Update files left", icon="mdi:update", update=UPDATE_SLOW),
+    "ps_upd_state": S(
+        "Power supply update state", icon="mdi:update", update=UPDATE_SLOW
+    ),
+    "p9s_upd_state": S(
+        "Acthor 9 Power supply update state", icon="mdi:update", update=UPDATE_SLOW
+    ),
     "cloudstate": S(
         "Cloud Status",
         icon="mdi:cloud-check",
@@ -443,9 +683,12 @@ SENSOR_TYPES = {
         "Debug IP",
         icon="mdi:ip-network",
         device="elwa elwa_min00201 acthor acthor_min00201 acthor9s acthor9s_min00201 elwa2",
+        update=UPDATE_STATIC,
     ),
     "cur_eth_mode": S(
-        "Ethernet-Modus", device="elwa2 solthor heathorIot35 heathorIot9"
+        "Ethernet-Modus",
+        device="elwa2 solthor heathorIot35 heathorIot9",
+        update=UPDATE_STATIC,
     ),
     # setup values
     "devmode": S("Device State", source="setup", icon="mdi:power", device="elwa"),
@@ -462,4 +705,117 @@ SENSOR_TYPES = {
         device="elwa",
     ),
     "cloudmode": S("Cloud Mode", source="setup", device="elwa"),
+    # energy integrated from the power values
+    "energy": S(
+        "Verbrauch Energie",
+        UnitOfEnergy.KILO_WATT_HOUR,
+        "mdi:lightning-bolt",
+        device="elwa solthor",
+        source="energy",
+    ),
+    "energy_solar": S(
+        "Solaranteil Energie",
+        UnitOfEnergy.KILO_WATT_HOUR,
+        "mdi:solar-power-variant",
+        device="acthor acthor9s acthor32 acthor329s elwa2 solthor",
+        source="energy",
+    ),
+    "energy_grid": S(
+        "Netzanteil Energie",
+        UnitOfEnergy.KILO_WATT_HOUR,
+        "mdi:transmission-tower-import",
+        device="acthor acthor9s acthor32 acthor329s elwa2 solthor heathorIot9 heathorIot35",
+        source="energy",
+    ),
+    "energy_act": S(
+        "Energie AC-Thor",
+        UnitOfEnergy.KILO_WATT_HOUR,
+        "mdi:lightning-bolt",
+        device="acthor",
+        source="energy",
+    ),
+    "apparent_power": S(
+        "Scheinleistung",
+        UnitOfApparentPower.VOLT_AMPERE,
+        "mdi:flash",
+        device="heathorIot9 acthor9s",
+        source="derived",
+    ),
+    "apparent_power_L1": S(
+        "Scheinleistung L1",
+        UnitOfApparentPower.VOLT_AMPERE,
+        "mdi:flash",
+        device="heathorIot9 acthor9s",
+        source="derived",
+    ),
+    "apparent_power_L2": S(
+        "Scheinleistung L2",
+        UnitOfApparentPower.VOLT_AMPERE,
+        "mdi:flash",
+        device="heathorIot9 acthor9s",
+        source="derived",
+    ),
+    "apparent_power_L3": S(
+        "Scheinleistung L3",
+        UnitOfApparentPower.VOLT_AMPERE,
+        "mdi:flash",
+        device="heathorIot9 acthor9s",
+        source="derived",
+    ),
+    "volt_imbalance": S(
+        "Spannungsunsymmetrie",
+        PERCENTAGE,
+        "mdi:scale-unbalanced",
+        device="heathorIot9 acthor9s",
+        source="derived",
+    ),
+    "curr_imbalance": S(
+        "Stromunsymmetrie",
+        PERCENTAGE,
+        "mdi:scale-unbalanced",
+        device="heathorIot9 acthor9s",
+        source="derived",
+    ),
+    "power_imbalance": S(
+        "Leistungsunsymmetrie",
+        PERCENTAGE,
+        "mdi:scale-unbalanced",
+        device="heathorIot9",
+        source="derived",
+    ),
+    "m0_phase_sum": S(
+        "Hausanschluss Summe L1-L3",
+        UnitOfPower.WATT,
+        "mdi:transmission-tower",
+        device="elwa",
+        source="derived",
+    ),
+    "m1_phase_sum": S(
+        "PV Leistung Summe L1-L3",
+        UnitOfPower.WATT,
+        "mdi:solar-power",
+        device="elwa",
+        source="derived",
+    ),
+    "m2_phase_sum": S(
+        "Batterie Summe L1-L3",
+        UnitOfPower.WATT,
+        "mdi:battery",
+        device="elwa",
+        source="derived",
+    ),
+    "m3_phase_sum": S(
+        "Ladestation Summe L1-L3",
+        UnitOfPower.WATT,
+        "mdi:ev-station",
+        device="elwa",
+        source="derived",
+    ),
+    "m4_phase_sum": S(
+        "Wärmepumpe Summe L1-L3",
+        UnitOfPower.WATT,
+        "mdi:heat-pump",
+        device="elwa",
+        source="derived",
+    ),
 }
@@ -0,0 +1,202 @@
+"""Closed-loop PV surplus controller driving the power of a MYPV device."""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN, UnitOfPower
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.dt import utcnow
+
+from .const import DOMAIN
+from .coordinator import MYPVDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class ControllerStatistics:
+    """Timing and quality of the control loop."""
+
+    cycles: int = 0
+    # setpoints computed from a new measurement
+    updates: int = 0
+    # cycles without a usable measurement or with a failed setpoint write
+    skipped: int = 0
+    # cycles started later than one interval after they were due
+    overruns: int = 0
+    # seconds from taking a new measurement to its setpoint being sent
+    last_latency: float = 0.0
+    mean_latency: float = 0.0
+    max_latency: float = 0.0
+    # largest grid power deviation beyond the target after the error changed
+    # its sign, in watt
+    last_overshoot: float = 0.0
+    max_overshoot: float = 0.0
+
+    def add_latency(self, latency: float) -> None:
+        """Count a setpoint update and its latency."""
+        self.updates += 1
+        self.last_latency = latency
+        self.mean_latency += (latency - self.mean_latency) / self.updates
+        self.max_latency = max(self.max_latency, latency)
+
+
+class PIController:
+    """PI controller with clamping anti-windup.
+
+    The output is limited to 0..maximum and the integral only grows while
+    the output is not saturated in the direction of the error, so it does
+    not wind up while the heater is at full power or off.
+    """
+
+    def __init__(self, kp: float, ki: float, maximum: float) -> None:
+        """Initialize the gains, ki is given per second."""
+        self.kp = kp
+        self.ki = ki
+        self.maximum = maximum
+        self.integral = 0.0
+
+    def update(self, error: float, dt: float) -> float:
+        """Return the output for the error after dt seconds."""
+        integral = self.integral + self.ki * error * dt
+        output = self.kp * error + integral
+        if output > self.maximum:
+            output = self.maximum
+            if error < 0:
+                self.integral = integral
+        elif output < 0:
+            output = 0.0
+            if error > 0:
+                self.integral = integral
+        else:
+            self.integral = integral
+        # keep the integral within the output range after a gain change
+        self.integral = min(max(self.integral, 0.0), self.maximum)
+        return output
+
+
+class SurplusController:
+    """Push the heater power at a fixed rate to keep the grid power at a target.
+
+    The grid power is read from a sensor entity, positive for import, or
+    from the meter of the device (m0sum, else the negated surplus). Every
+    interval a PI controller turns the deviation from the target into a
+    power setpoint which is sent to the device. Without a new measurement
+    the last setpoint is sent again, so a slowly updating source does not
+    make the integral run away.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: MYPVDataUpdateCoordinator,
+        *,
+        entity_id: str | None,
+        target: float,
+        kp: float,
+        ki: float,
+        interval: float,
+        max_power: float,
+    ) -> None:
+        """Initialize the controller of a device."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.entity_id = entity_id
+        self.target = target
+        self.interval = interval
+        self.pi = PIController(kp, ki, max_power)
+        self.statistics = ControllerStatistics()
+        self._task: asyncio.Task | None = None
+        self._setpoint = 0
+        self._measured: datetime | None = None
+        self._last_error = 0.0
+        self._crossed = False
+        self._excursion = 0.0
+
+    def start(self) -> None:
+        """Start the control loop."""
+        self._task = self.hass.async_create_background_task(
+            self._async_run(), f"{DOMAIN} surplus controller {self.coordinator.host}"
+        )
+
+    async def async_stop(self) -> None:
+        """Stop the control loop and release the heater."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        self._task = None
+        try:
+            await self.coordinator.async_set_power(0)
+        except HomeAssistantError as error:
+            _LOGGER.warning("Failed to release the heater: %s", error)
+
+    def _measure(self) -> tuple[float, datetime] | None:
+        """Return the grid power in watt and the time it was measured."""
+        if self.entity_id:
+            state = self.hass.states.get(self.entity_id)
+            if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                return None
+            try:
+                power = float(state.state)
+            except ValueError:
+                return None
+            if state.attributes.get("unit_of_measurement") == UnitOfPower.KILO_WATT:
+                power *= 1000
+            return power, state.last_updated
+        data = (self.coordinator.data or {}).get("data") or {}
+        if "m0sum" in data:
+            power = float(data["m0sum"])
+        elif "surplus" in data:
+            power = -float(data["surplus"])
+        else:
+            return None
+        return power, self.coordinator.data_received
+
+    def _track_overshoot(self, error: float) -> None:
+        """Record the peak deviation from the target after it was crossed."""
+        if error * self._last_error < 0:
+            self._crossed = True
+            self._excursion = 0.0
+        if self._crossed:
+            self._excursion = max(self._excursion, abs(error))
+            self.statistics.last_overshoot = self._excursion
+            self.statistics.max_overshoot = max(
+                self.statistics.max_overshoot, self._excursion
+            )
+        self._last_error = error
+
+    async def _async_run(self) -> None:
+        """Run a control cycle every interval."""
+        loop = self.hass.loop
+        due = loop.time()
+        while True:
+            due += self.interval
+            await asyncio.sleep(max(due - loop.time(), 0))
+            if (late := loop.time() - due) > self.interval:
+                self.statistics.overruns += 1
+                due += late // self.interval * self.interval
+            if (measurement := self._measure()) is None:
+                self.statistics.skipped += 1
+                continue
+            power, measured = measurement
+            fresh = measured != self._measured
+            if fresh:
+                dt = self.interval
+                if self._measured is not None:
+                    dt = max((measured - self._measured).total_seconds(), dt)
+                self._measured = measured
+                error = self.target - power
+                self._track_overshoot(error)
+                self._setpoint = round(self.pi.update(error, dt))
+            try:
+                await self.coordinator.async_set_power(self._setpoint)
+            except HomeAssistantError as ex:
+                _LOGGER.debug("Failed to send setpoint: %s", ex)
+                self.statistics.skipped += 1
+                continue
+            self.statistics.cycles += 1
+            if fresh:
+                self.statistics.add_latency((utcnow() - measured).total_seconds())
@@ -1,21 +1,81 @@
 """Provides the MYPV DataUpdateCoordinator."""
 
 import asyncio
+from dataclasses import dataclass
 from datetime import timedelta
 import json
 import logging
+import re
+from typing import Any
 
-import requests
+import aiohttp
 
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util.dt import utcnow
 
-from .const import DOMAIN
+from .archive import SampleArchive
+from .connection import MYPVConnectionPool
+from .const import (
+    ARCHIVE_FILE_SIZE,
+    DEFAULT_ARCHIVE_RETENTION,
+    DEFAULT_HISTORY_KEYS,
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_INFO_INTERVAL,
+    DEFAULT_MAX_POLLING_INTERVAL,
+    DEFAULT_MIN_POLLING_INTERVAL,
+    DEFAULT_PAGE_TIMEOUT,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SETUP_INTERVAL,
+    DERIVED_SENSORS,
+    DOMAIN,
+    ENERGY_SOURCES,
+    FIRMWARE_INTERVAL,
+    PAGE_TIMEOUTS,
+    REFRESH_TIMEOUT,
+    ROLLUP_TIERS,
+    SENSOR_TYPES,
+    UPDATE_INTERVALS,
+    VOLATILE_FIELDS,
+)
+from .energy import EnergyIntegrator
+from .history import SampleBuffer
+from .phases import derive_phase_metrics, phase_sources
+from .polling import AdaptivePolling
+from .rollups import SampleRollups
+from .values import Converter, compile_converters
+from .writer import SetupWriter
 
 _LOGGER = logging.getLogger(__name__)
 
+# matches the clock fields of a raw page, which change on every poll
+_VOLATILE_RE = re.compile(
+    rb'"(' + b"|".join(f.encode() for f in VOLATILE_FIELDS) + rb')":\s*("[^"]*"|-?\d+)'
+)
+
+# update class: (page, key) contexts published on the schedule of the class
+_SCHEDULED_CONTEXTS = {
+    update: {
+        (description.source, key)
+        for key, description in SENSOR_TYPES.items()
+        if description.update == update
+    }
+    for update in UPDATE_INTERVALS
+}
+
+
+@dataclass
+class RefreshStatistics:
+    """Counters of refreshes answered without new device data."""
+
+    refreshes: int = 0
+    unchanged_pages: int = 0
+    unchanged_refreshes: int = 0
+
 
 class MYPVDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching MYPV data."""
@@ -26,82 +86,483 @@ class MYPVDataUpdateCoordinator(DataUpdateCoordinator):
         self.host = config[CONF_HOST]
         self._info = None
         self._setup = None
+        # timestamp the setup page was last read or answered to a write
+        self._setup_received = 0.0
         self._firmware = None
-        self._next_update = 0
+        # firmware version reported by the last data page
+        self._data_fwversion: str | None = None
+        # page: refresh interval in seconds, 0 = only on demand
+        self._schedules = {
+            "setup": options.get("setup_interval", DEFAULT_SETUP_INTERVAL),
+            "mypv_dev": options.get("info_interval", DEFAULT_INFO_INTERVAL),
+        }
+        # page: timestamp the page is due again, missing = due now
+        self._next_update: dict[str, float] = {}
         self._next_update_firmware = 0
-        self.update_interval = timedelta(seconds=10)
+        self.update_interval = timedelta(
+            seconds=options.get("polling_interval", DEFAULT_POLLING_INTERVAL)
+        )
+        self._adaptive = None
+        if options.get("adaptive_polling"):
+            self._adaptive = AdaptivePolling(
+                options.get("min_polling_interval", DEFAULT_MIN_POLLING_INTERVAL),
+                self.update_interval.total_seconds(),
+                options.get("max_polling_interval", DEFAULT_MAX_POLLING_INTERVAL),
+            )
+        self.pool = MYPVConnectionPool(self._host)
+        # orders the reads of a refresh and the writes to the device
+        self.channel = asyncio.Lock()
+        self.writer = SetupWriter(
+            hass,
+            self.pool,
+            self.channel,
+            self.async_apply_setup,
+            self._recent_setup,
+        )
+        self.statistics = RefreshStatistics()
+        # page: (fingerprint of the raw payload, parsed payload)
+        self._payloads: dict[str, tuple[bytes, dict]] = {}
+        # page: keys changed by the payload fetched in this refresh, None = all
+        self._page_changes: dict[str, set[str] | None] = {}
+        # (page, key) contexts changed by the last refresh, None = all
+        self._changed: set[tuple[str, str]] | None = None
+        # context: update callbacks, rebuilt when listeners change
+        self._listener_index: dict[object, list[CALLBACK_TYPE]] | None = None
+        # update class: timestamp its values are published again
+        self._next_publish: dict[str, float] = {}
+        # converted sensor states, valid until their key changes
+        self._converters: dict[str, Converter] = {}
+        self._values: dict[str, Any] = {}
+        self._valid_values: set[str] = set()
+        self._missing_values: set[str] = set()
+        # metrics derived from the three-phase values of the last data page
+        self._derived: dict[str, float | None] = {}
+        # time the last data page was received
+        self.data_received = utcnow()
+        self.history = SampleBuffer(
+            tuple(options.get("history_keys", DEFAULT_HISTORY_KEYS)),
+            options.get("history_size", DEFAULT_HISTORY_SIZE),
+        )
+        # created once the serial number of the device is known
+        self.archive: SampleArchive | None = None
+        self._archive_retention = (
+            options.get("archive_retention", DEFAULT_ARCHIVE_RETENTION) * 86400
+            if options.get("archive_history")
+            else 0
+        )
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=self.update_interval,
+            always_update=False,
         )
+        entry_id = self.config_entry.entry_id if self.config_entry else self._host
+        self.energy = EnergyIntegrator(hass, entry_id, ENERGY_SOURCES)
+        self.rollups = SampleRollups(hass, entry_id, self.history.keys, ROLLUP_TIERS)
 
     async def _async_update_data(self) -> dict:
         """Fetch data from NZBGet."""
-
-        def _update_data() -> dict:
-            """Fetch data from NZBGet via sync functions."""
-            data = self.json_update("data")
-            if self._info is None:
-                self._info = self.json_update("mypv_dev")
-
-            if self._setup is None or self._next_update < utcnow().timestamp():
-                self._next_update = utcnow().timestamp() + 120  # 86400
-                self._setup = self.json_update("setup")
-
-            if (
-                self._firmware is None
-                or self._next_update_firmware < utcnow().timestamp()
-            ):
-                self._next_update_firmware = utcnow().timestamp() + (7 * 86400)
-                # @todo self._firmware = self.firmware_update()
-
-            return {
-                "data": data,
-                "info": self._info,
-                "setup": self._setup,
-                "firmware": self._firmware,
-            }
-
+        # listeners are notified about everything unless the refresh succeeds
+        # and the device was already available before
+        self._changed = None
+        available = self.last_update_success
         try:
-            async with asyncio.timeout(4):
-                return await self.hass.async_add_executor_job(_update_data)
+            async with asyncio.timeout(REFRESH_TIMEOUT):
+                data = await self._update_data()
         except Exception as error:
             raise UpdateFailed(f"Invalid response from API: {error}") from error
 
+        if available:
+            self._changed = self._changed_contexts()
+        if self._changed is None:
+            self._converters = compile_converters((data["info"] or {}).get("device"))
+            self._valid_values.clear()
+        else:
+            self._valid_values.difference_update(key for _, key in self._changed)
+        if available and data is self.data and self._changed != set():
+            # the same snapshot skips the listeners, so values due on their
+            # schedule, such as the clock fields, are published here
+            self.async_update_listeners()
+        if self._adaptive is not None and data["data"]:
+            self.update_interval = timedelta(
+                seconds=self._adaptive.next_interval(
+                    data["data"], (data["info"] or {}).get("device")
+                )
+            )
+        return data
+
+    def _changed_contexts(self) -> set[tuple[str, str]] | None:
+        """Return the (page, key) contexts changed by the current refresh."""
+        now = utcnow().timestamp()
+        if "mypv_dev" in self._page_changes or None in self._page_changes.values():
+            for update, interval in UPDATE_INTERVALS.items():
+                self._next_publish[update] = now + interval
+            return None
+        changed = set()
+        for page, keys in self._page_changes.items():
+            changed.update((page, key) for key in keys)
+        for key, sources in DERIVED_SENSORS.items():
+            if any(("data", source) in changed for source in sources):
+                changed.add(("data", key))
+        # static and slow values are published on their own schedule only
+        for update, interval in UPDATE_INTERVALS.items():
+            if self._next_publish.get(update, 0) <= now:
+                self._next_publish[update] = now + interval
+                changed |= _SCHEDULED_CONTEXTS[update]
+            else:
+                changed -= _SCHEDULED_CONTEXTS[update]
+        return changed
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: object = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates and invalidate the listener index."""
+        remove = super().async_add_listener(update_callback, context)
+        self._listener_index = None
+
+        @callback
+        def remove_listener() -> None:
+            remove()
+            self._listener_index = None
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose context changed in the last refresh."""
+        changed, self._changed = self._changed, None
+        if changed is None or not self.last_update_success:
+            super().async_update_listeners()
+            return
+        if self._listener_index is None:
+            self._listener_index = {}
+            for update_callback, context in self._listeners.values():
+                self._listener_index.setdefault(context, []).append(update_callback)
+        for update_callback in self._listener_index.get(None, ()):
+            update_callback()
+        for context in changed:
+            for update_callback in self._listener_index.get(context, ()):
+                update_callback()
+
+    def value(self, sensor_type: str) -> Any:
+        """Return the converted state of a sensor.
+
+        The state is converted at most once per refresh and reused until one
+        of the keys it is computed from changes. If its page could not be
+        read the last state is kept.
+        """
+        if sensor_type in self._valid_values:
+            return self._values.get(sensor_type)
+        payload = self.data[SENSOR_TYPES[sensor_type].source] if self.data else None
+        if payload is None:
+            return self._values.get(sensor_type)
+        try:
+            value = self._converters[sensor_type](payload)
+        except KeyError:
+            value = None
+            if sensor_type not in self._missing_values:
+                self._missing_values.add(sensor_type)
+                _LOGGER.warning(
+                    "State %s not found on device. You should remove it from the"
+                    " configuration",
+                    sensor_type,
+                )
+        except (TypeError, ValueError) as ex:
+            _LOGGER.error(ex)
+            return self._values.get(sensor_type)
+        self._values[sensor_type] = value
+        self._valid_values.add(sensor_type)
+        return value
+
+    @callback
+    def async_apply_setup(self, raw: bytes) -> dict:
+        """Store a setup page the device answered to a write and return it.
+
+        The answer is as fresh as a scheduled read, so it replaces the setup
+        page of the snapshot and only the entities reading one of the changed
+        keys are notified.
+        """
+        data, changes = self._parse_page("setup", raw)
+        self._setup_received = utcnow().timestamp()
+        self._schedule_page("setup", self._setup_received)
+        if self.data is None or data is self.data["setup"] and not changes:
+            self._setup = data
+            return data
+        self._setup = data
+        self.data = {**self.data, "setup": data}
+        if changes is None:
+            self._valid_values.clear()
+            self._changed = None
+        else:
+            self._valid_values.difference_update(changes)
+            self._changed = {("setup", key) for key in changes}
+        self.async_update_listeners()
+        return data
+
+    def _recent_setup(self) -> dict:
+        """Return the setup page if it was read within the last poll.
+
+        The setup page is only read on its own schedule or when entities
+        need it, an older page may miss changes made on the device.
+        """
+        age = utcnow().timestamp() - self._setup_received
+        if self._setup is None or age > self.update_interval.total_seconds():
+            return {}
+        return self._setup
+
+    async def async_set_power(self, power: int) -> None:
+        """Send a heater power setpoint, the device has to be in HTTP control.
+
+        The setpoint is not a setup parameter: it is sent as control.html
+        request through the command channel and not stored on the device.
+        """
+        try:
+            async with self.channel:
+                await self.pool.async_get(
+                    "control", params={"power": power}, extension="html"
+                )
+        except (aiohttp.ClientError, TimeoutError) as error:
+            raise HomeAssistantError(f"Failed to set power {power}: {error}") from error
+
+    def request_page_refresh(self, page: str) -> None:
+        """Fetch the page with the next refresh regardless of its schedule."""
+        self._next_update.pop(page, None)
+
+    def _pages_in_demand(self) -> set[str]:
+        """Return the pages the enabled entities read their values from.
+
+        Entities register with a (page, key) context. Before any entity is
+        added the demand is unknown and every page is considered needed.
+        """
+        if not self._listeners:
+            return set(self._schedules)
+        return {page for page, _ in self.async_contexts()}
+
+    def _page_due(self, page: str, now: float) -> bool:
+        """Return True if the page has to be fetched in this refresh."""
+        return self._next_update.get(page, 0) <= now
+
+    def _schedule_page(self, page: str, now: float) -> None:
+        """Set the time the page is due again after fetching it."""
+        if interval := self._schedules[page]:
+            self._next_update[page] = now + interval
+        else:
+            self._next_update[page] = float("inf")
+
+    async def _update_data(self) -> dict:
+        """Fetch all due pages from the device concurrently."""
+        now = utcnow().timestamp()
+        self._page_changes = {}
+        if not self.last_update_success:
+            # the device may have rebooted while it was unreachable
+            self.request_page_refresh("mypv_dev")
+        demand = self._pages_in_demand()
+        pages = ["data"]
+        pages.extend(
+            page
+            for page in self._schedules
+            if self._page_due(page, now) and (page in demand or page == "mypv_dev")
+        )
+
+        results = await self._fetch_pages(pages)
+        data = results["data"]
+        # data.jsn and mypv_dev.jsn may format the firmware version differently,
+        # so a change is detected against the previous data page only
+        fwversion = (data or {}).get("fwversion", self._data_fwversion)
+        if (
+            self._data_fwversion is not None
+            and fwversion != self._data_fwversion
+            and "mypv_dev" not in results
+        ):
+            # firmware changed, the device info is outdated
+            results.update(await self._fetch_pages(["mypv_dev"]))
+        self._data_fwversion = fwversion
+
+        for page, result in results.items():
+            if page in self._schedules and result is not None:
+                self._schedule_page(page, now)
+        # a failed page keeps its last content and stays due
+        if results.get("mypv_dev") is not None:
+            self._info = results["mypv_dev"]
+        if results.get("setup") is not None:
+            self._setup = results["setup"]
+            self._setup_received = now
+
+        if self._firmware is None or self._next_update_firmware < now:
+            self._next_update_firmware = now + FIRMWARE_INTERVAL
+            # @todo self._firmware = await self.firmware_update()
+
+        if data:
+            self.data_received = utcnow()
+            sample = self._sample(data, self.history.keys)
+            self.history.append(now, sample)
+            self.rollups.add(now, sample)
+            self._archive_sample(now, sample)
+            self._integrate_energy(data)
+            self._derive_metrics(data)
+
+        self.statistics.refreshes += 1
+        if (
+            self.data is not None
+            and data is self.data["data"]
+            and self._info is self.data["info"]
+            and self._setup is self.data["setup"]
+            and self._firmware is self.data["firmware"]
+            and self.energy.published is self.data["energy"]
+            and self._derived is self.data["derived"]
+        ):
+            # nothing changed, returning the same snapshot skips the listeners
+            self.statistics.unchanged_refreshes += 1
+            return self.data
+
+        return {
+            "data": data,
+            "info": self._info,
+            "setup": self._setup,
+            "firmware": self._firmware,
+            "energy": self.energy.published,
+            "derived": self._derived,
+        }
+
+    def _sample(self, data: dict, keys: tuple[str, ...]) -> dict[str, float]:
+        """Return the converted numeric values of the keys in a data page."""
+        if not self._converters:
+            # first refresh, the converters are compiled after it otherwise
+            self._converters = compile_converters((self._info or {}).get("device"))
+        values = {}
+        for key in keys:
+            if (converter := self._converters.get(key)) is None:
+                continue
+            try:
+                values[key] = float(converter(data))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return values
+
+    def _archive_sample(self, now: float, sample: dict[str, float]) -> None:
+        """Queue a sample for the on-disk archive and write due batches."""
+        if not self._archive_retention or not self._info or "sn" not in self._info:
+            return
+        if self.archive is None:
+            self.archive = SampleArchive(
+                self.hass,
+                self.hass.config.path(STORAGE_DIR, DOMAIN, str(self._info["sn"])),
+                self.history.keys,
+                ARCHIVE_FILE_SIZE,
+                self._archive_retention,
+            )
+        if self.archive.append(now, sample):
+            self.hass.async_create_background_task(
+                self.archive.async_flush(), f"{DOMAIN} archive {self.host}"
+            )
+
+    def _derive_metrics(self, data: dict) -> None:
+        """Compute the three-phase metrics of a data page."""
+        model = (self._info or {}).get("device")
+        derived = derive_phase_metrics(self._sample(data, phase_sources(model)), model)
+        if changed := {
+            key for key, value in derived.items() if self._derived.get(key) != value
+        }:
+            self._derived = derived
+            self._page_changes["derived"] = changed
+
+    def _integrate_energy(self, data: dict) -> None:
+        """Add the power values of a data page to the energy accumulators.
+
+        The samples are timed by the device clock where data.jsn reports it,
+        by the time the page was received otherwise.
+        """
+        powers = self._sample(data, tuple(ENERGY_SOURCES.values()))
+        time = data.get("unixtime") or self.data_received.timestamp()
+        if changed := self.energy.add_sample(float(time), powers):
+            self._page_changes["energy"] = changed
+
+    async def _fetch_pages(self, pages: list[str]) -> dict:
+        """Fetch the pages concurrently and return them by page name."""
+        # a task group cancels the sibling requests as soon as one fails or
+        # the refresh deadline expires, so no socket outlives the refresh;
+        # the channel keeps writes from interleaving with the reads
+        async with self.channel, asyncio.TaskGroup() as group:
+            tasks = {page: group.create_task(self.json_update(page)) for page in pages}
+        return {page: task.result() for page, task in tasks.items()}
+
+    async def async_shutdown(self) -> None:
+        """Stop polling and writing, close the connection pool, save the samples."""
+        await super().async_shutdown()
+        self.writer.cancel()
+        await self.pool.async_close()
+        await self.energy.async_save()
+        await self.rollups.async_save()
+        if self.archive is not None:
+            await self.archive.async_flush()
+
     def set_interval(self, new_interval: int):
         """Update polling interval."""
+        if self._adaptive is not None:
+            self._adaptive.set_base(new_interval)
+            new_interval = self._adaptive.interval
         self.update_interval = timedelta(seconds=new_interval)
 
-    def json_update(self, page: str):
+    async def json_update(self, page: str):
         """Update inverter data."""
         try:
-            response = requests.get(f"http://{self._host}/{page}.jsn", timeout=10)
-            data = json.loads(response.text)
-            _LOGGER.debug(data)
-        except (requests.RequestException, json.JSONDecodeError) as error:
+            raw = await self.pool.async_get(
+                page, timeout=PAGE_TIMEOUTS.get(page, DEFAULT_PAGE_TIMEOUT)
+            )
+            data, changes = self._parse_page(page, raw)
+        except (aiohttp.ClientError, json.JSONDecodeError) as error:
             _LOGGER.error("Failed to update JSON data: %s", error)
+            self._page_changes[page] = None
+            self._payloads.pop(page, None)
             return None
-        else:
-            return data
+        if changes is None or changes:
+            self._page_changes[page] = changes
+        return data
 
-    def firmware_update(self):
+    def _parse_page(self, page: str, raw: bytes) -> tuple[dict, set[str] | None]:
+        """Parse a raw page and return it with its changed keys, None = all.
+
+        If the raw payload equals the previous one of the page, apart from the
+        clock fields, the previously parsed payload is returned with only the
+        clock fields refreshed and no changed keys.
+        """
+        fingerprint = _VOLATILE_RE.sub(b"", raw)
+        if (previous := self._payloads.get(page)) and previous[0] == fingerprint:
+            self.statistics.unchanged_pages += 1
+            data = previous[1]
+            for key, value in _VOLATILE_RE.findall(raw):
+                data[key.decode()] = json.loads(value)
+            return data, set()
+        data = json.loads(raw)
+        _LOGGER.debug(data)
+        changes = None
+        if previous is not None:
+            old = previous[1]
+            changes = {
+                key for key in data.keys() | old.keys() if data.get(key) != old.get(key)
+            }
+        self._payloads[page] = (fingerprint, data)
+        return data, changes
+
+    async def firmware_update(self):
         """Read the firmware info."""
+        session = async_get_clientsession(self.hass)
         try:
-            response = requests.get(
-                "https://www.my-pv.com/download/currentversion.php?sn="
-                + self._info.get("sn"),
-                timeout=10,
-            )
-            info = json.loads(response.text)
+            async with session.get(
+                "https://www.my-pv.com/download/currentversion.php",
+                params={"sn": self._info.get("sn")},
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                info = json.loads(await response.read())
             _LOGGER.debug(info)
-        except requests.RequestException:
+        except aiohttp.ClientError:
             _LOGGER.error("Failed to load firmware info")
-            return json.loads("{}")
+            return {}
         except json.JSONDecodeError:
             _LOGGER.error("Failed to decode JSON")
-            return json.loads("{}")
+            return {}
         else:
             return info
@@ -0,0 +1,71 @@
+"""Deadband filter limiting state writes of noisy MYPV sensors."""
+
+from numbers import Real
+from typing import Any
+
+# absolute slack of the band comparison, far below the device resolution
+_TOLERANCE = 1e-9
+
+
+class Deadband:
+    """Decide whether a new sensor value is worth publishing.
+
+    A value is published if it leaves the band around the last published
+    value, the band being the larger of the absolute deadband and the relative
+    deadband times the published value. Values are published at most every
+    min_interval seconds, and a value differing from the published one is
+    published at the latest after max_age seconds so statistics stay correct.
+    """
+
+    def __init__(
+        self,
+        absolute: float,
+        relative: float,
+        min_interval: float,
+        max_age: float,
+    ) -> None:
+        """Initialize the filter."""
+        self.absolute = absolute
+        self.relative = relative
+        self.min_interval = min_interval
+        self.max_age = max_age
+        self.published = False
+        self.value: Any = None
+        self._time = 0.0
+
+    def _outside(self, value: Any) -> bool:
+        """Return True if the value leaves the band around the published one."""
+        if not isinstance(value, Real) or not isinstance(self.value, Real):
+            return True
+        band = max(self.absolute, self.relative * abs(self.value))
+        # a change of exactly the band, e.g. 45.2 - 45.1, stays within it
+        return abs(value - self.value) > band + _TOLERANCE
+
+    def accept(self, value: Any, now: float) -> bool:
+        """Return True and remember the value if it has to be published."""
+        if self.published and value != self.value:
+            age = now - self._time
+            if (
+                age < self.max_age
+                and isinstance(value, Real)
+                and isinstance(self.value, Real)
+                and (age < self.min_interval or not self._outside(value))
+            ):
+                return False
+        self.publish(value, now)
+        return True
+
+    def publish(self, value: Any, now: float) -> None:
+        """Remember the value as published."""
+        self.published = True
+        self.value = value
+        self._time = now
+
+    def due_in(self, value: Any, now: float) -> float:
+        """Return the seconds until a held back value has to be published.
+
+        A value outside the band is only held back until min_interval is
+        over, a value within the band until max_age is reached.
+        """
+        limit = self.min_interval if self._outside(value) else self.max_age
+        return max(limit - (now - self._time), 0)
@@ -0,0 +1,31 @@
+"""Diagnostics support for MYPV."""
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_CONTROLLER, DATA_COORDINATOR, DOMAIN
+from .coordinator import MYPVDataUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the refresh, connection, write and control loop statistics."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: MYPVDataUpdateCoordinator = entry_data[DATA_COORDINATOR]
+    diagnostics = {
+        "options": dict(entry.options),
+        "update_interval": coordinator.update_interval.total_seconds(),
+        "refresh": asdict(coordinator.statistics),
+        "connections": {
+            **asdict(coordinator.pool.statistics),
+            "reuse_ratio": coordinator.pool.statistics.reuse_ratio,
+        },
+        "writes": asdict(coordinator.writer.statistics),
+    }
+    if (controller := entry_data.get(DATA_CONTROLLER)) is not None:
+        diagnostics["controller"] = asdict(controller.statistics)
+    return diagnostics
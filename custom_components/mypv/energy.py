@@ -0,0 +1,94 @@
+"""Energy accumulators integrating the power samples of a MYPV device."""
+
+import logging
+import math
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, ENERGY_MAX_GAP, ENERGY_PUBLISH_STEP
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store of the energy totals of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.energy.{entry_id}")
+
+
+async def async_remove_energy(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the persisted energy totals of a config entry."""
+    await _store(hass, entry_id).async_remove()
+
+
+class EnergyIntegrator:
+    """Integrate power samples to energy with the trapezoidal rule.
+
+    The device clock (unixtime) is used as time base. Intervals longer than
+    ENERGY_MAX_GAP or with a clock going backwards (reboot, outage) are not
+    integrated. The totals are persisted and survive restarts.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, sources: dict) -> None:
+        """Initialize the accumulators, sources maps energy key to power key."""
+        self.sources = sources
+        self.totals: dict[str, float] = dict.fromkeys(sources, 0.0)
+        self.published: dict[str, float] = {}
+        self._last_time: float | None = None
+        self._last_power: dict[str, float] = {}
+        self._store = _store(hass, entry_id)
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load the persisted totals."""
+        if stored := await self._store.async_load():
+            for key, total in stored.get("totals", {}).items():
+                if key in self.totals:
+                    self.totals[key] = total
+        self.published = self._rounded()
+
+    async def async_save(self) -> None:
+        """Persist the totals now."""
+        await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict:
+        self._save_scheduled = False
+        return {"totals": self.totals}
+
+    def _rounded(self) -> dict[str, float]:
+        """Return the totals rounded down to the publish step."""
+        return {
+            key: round(math.floor(total / ENERGY_PUBLISH_STEP) * ENERGY_PUBLISH_STEP, 6)
+            for key, total in self.totals.items()
+        }
+
+    def add_sample(self, unixtime: float, powers: dict[str, float]) -> set[str]:
+        """Integrate a power sample in watt and return the changed energy keys.
+
+        powers maps the power keys to their value, missing keys are skipped.
+        """
+        last_time, self._last_time = self._last_time, unixtime
+        last_power, self._last_power = self._last_power, powers
+        if last_time is None or not 0 < unixtime - last_time <= ENERGY_MAX_GAP:
+            return set()
+        hours = (unixtime - last_time) / 3600
+        for key, power_key in self.sources.items():
+            if power_key in powers and power_key in last_power:
+                average = (
+                    max(powers[power_key], 0) + max(last_power[power_key], 0)
+                ) / 2
+                self.totals[key] += average * hours / 1000
+        published = self._rounded()
+        changed = {
+            key for key, total in published.items() if total != self.published.get(key)
+        }
+        if changed:
+            self.published = published
+            # scheduling again would postpone the save while the power is on
+            if not self._save_scheduled:
+                self._save_scheduled = True
+                self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return changed
@@ -0,0 +1,121 @@
+"""In-memory ring buffer of the recent samples of a MYPV device."""
+
+from array import array
+import math
+from typing import Any
+
+
+class SampleBuffer:
+    """Keep the last samples of some numeric keys in typed arrays.
+
+    Every key is a column of doubles sharing one column of timestamps, the
+    oldest sample being overwritten once the buffer is full. Missing or
+    non-numeric values are stored as NaN and left out of the queries.
+    """
+
+    def __init__(self, keys: tuple[str, ...], size: int) -> None:
+        """Initialize the buffer for size samples of the keys."""
+        self.keys = tuple(keys)
+        self.size = size
+        self.count = 0
+        self._head = 0
+        self._times = array("d", bytes(8 * size))
+        self._columns = {key: array("d", [math.nan]) * size for key in self.keys}
+
+    def append(self, time: float, values: dict[str, float]) -> None:
+        """Store a sample, values maps the keys to their value."""
+        if not self.size:
+            return
+        head = self._head
+        self._times[head] = time
+        for key, column in self._columns.items():
+            value = values.get(key)
+            column[head] = value if isinstance(value, int | float) else math.nan
+        self._head = (head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def _index(self, position: int) -> int:
+        """Return the array index of the position-th oldest sample."""
+        return (self._head - self.count + position) % self.size
+
+    def _bisect(self, time: float) -> int:
+        """Return the position of the first sample not older than time."""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._times[self._index(middle)] < time:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _positions(self, start: float | None, end: float | None) -> range:
+        """Return the positions of the samples between start and end."""
+        first = 0 if start is None else self._bisect(start)
+        last = (
+            self.count if end is None else self._bisect(math.nextafter(end, math.inf))
+        )
+        return range(first, last)
+
+    def window(
+        self, keys: tuple[str, ...], start: float | None, end: float | None
+    ) -> dict[str, list]:
+        """Return the raw samples of the keys between start and end."""
+        indexes = [self._index(position) for position in self._positions(start, end)]
+        result = {"time": [self._times[index] for index in indexes]}
+        for key in keys:
+            column = self._columns[key]
+            result[key] = [
+                None if math.isnan(value := column[index]) else value
+                for index in indexes
+            ]
+        return result
+
+    def downsample(
+        self,
+        keys: tuple[str, ...],
+        start: float | None,
+        end: float | None,
+        step: float,
+    ) -> dict[str, Any]:
+        """Return the min, mean and max of the keys per step seconds."""
+        return downsample(self.window(keys, start, end), step)
+
+
+def downsample(samples: dict[str, list], step: float) -> dict[str, Any]:
+    """Return the min, mean and max of raw samples per step seconds.
+
+    samples holds the sample times and the values per key as returned by a
+    window query. The buckets are aligned to multiples of step, empty buckets
+    are left out and a bucket without a value of a key reports None for it.
+    """
+    buckets: list[float] = []
+    ranges: list[range] = []
+    first = 0
+    times = samples["time"]
+    for position, time in enumerate(times):
+        bucket = time // step * step
+        if not buckets or buckets[-1] != bucket:
+            if buckets:
+                ranges.append(range(first, position))
+            buckets.append(bucket)
+            first = position
+    if buckets:
+        ranges.append(range(first, len(times)))
+
+    result: dict[str, Any] = {"time": buckets}
+    for key, column in samples.items():
+        if key == "time":
+            continue
+        minimums, means, maximums = [], [], []
+        for positions in ranges:
+            values = [
+                value
+                for position in positions
+                if (value := column[position]) is not None
+            ]
+            minimums.append(min(values) if values else None)
+            means.append(sum(values) / len(values) if values else None)
+            maximums.append(max(values) if values else None)
+        result[key] = {"min": minimums, "mean": means, "max": maximums}
+    return result
@@ -0,0 +1,73 @@
+"""Metrics derived from the three-phase values of a MYPV device."""
+
+from .const import METER_PHASES, MYPV_DEVICES, PHASE_KEYS
+
+# derived metric: quantity of PHASE_KEYS it is computed from
+IMBALANCES = {
+    "volt_imbalance": "volt",
+    "curr_imbalance": "curr",
+    "power_imbalance": "power",
+}
+
+# keys of the meter phases, the same on every device
+_METER_SOURCES = tuple(key for phases in METER_PHASES.values() for key in phases)
+
+# every derived metric
+PHASE_METRICS = (
+    "apparent_power",
+    *(f"apparent_power_L{phase}" for phase in (1, 2, 3)),
+    *IMBALANCES,
+    *(f"{meter}_phase_sum" for meter in METER_PHASES),
+)
+
+
+def phase_keys(model: str | None) -> dict[str, tuple[str, str, str]]:
+    """Return the per-phase keys of a device model by quantity."""
+    return PHASE_KEYS.get(MYPV_DEVICES.get(model), {})
+
+
+def phase_sources(model: str | None) -> tuple[str, ...]:
+    """Return every key the metrics of a device model are computed from."""
+    keys = phase_keys(model)
+    return (*(key for phases in keys.values() for key in phases), *_METER_SOURCES)
+
+
+def _imbalance(phases: tuple[float, float, float]) -> float | None:
+    """Return the largest deviation from the mean in percent of the mean."""
+    mean = sum(phases) / 3
+    if not mean:
+        return 0.0 if not any(phases) else None
+    return round(max(abs(phase - mean) for phase in phases) / abs(mean) * 100, 1)
+
+
+def derive_phase_metrics(
+    values: dict[str, float], model: str | None
+) -> dict[str, float | None]:
+    """Compute all derived metrics of a sample in one pass.
+
+    values maps the phase_sources of the model to their converted value. A
+    metric whose phase values are not all available is None.
+    """
+    metrics: dict[str, float | None] = dict.fromkeys(PHASE_METRICS)
+    keys = phase_keys(model)
+
+    def phases(quantity_keys: tuple[str, ...] | None) -> tuple[float, ...] | None:
+        if quantity_keys is None:
+            return None
+        row = tuple(values[key] for key in quantity_keys if key in values)
+        return row if len(row) == len(quantity_keys) else None
+
+    voltages = phases(keys.get("volt"))
+    currents = phases(keys.get("curr"))
+    if voltages and currents:
+        apparent = [round(volt * curr, 1) for volt, curr in zip(voltages, currents)]
+        for phase, power in enumerate(apparent, 1):
+            metrics[f"apparent_power_L{phase}"] = power
+        metrics["apparent_power"] = round(sum(apparent), 1)
+    for metric, quantity in IMBALANCES.items():
+        if row := phases(keys.get(quantity)):
+            metrics[metric] = _imbalance(row)
+    for meter, meter_keys in METER_PHASES.items():
+        if row := phases(meter_keys):
+            metrics[f"{meter}_phase_sum"] = sum(row)
+    return metrics
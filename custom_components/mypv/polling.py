@@ -0,0 +1,63 @@
+"""Adaptive polling interval for MYPV devices."""
+
+from .const import (
+    ADAPTIVE_CHANGE_THRESHOLD,
+    ADAPTIVE_SIGNALS,
+    IDLE_STATES,
+    MYPV_DEVICES,
+)
+
+
+class AdaptivePolling:
+    """Derive the next polling interval from the dynamics of the device data.
+
+    While one of the ADAPTIVE_SIGNALS changes by ADAPTIVE_CHANGE_THRESHOLD or
+    more between two polls the device is polled at the minimum interval.
+    Once the signals settle the interval doubles on every poll up to the
+    configured polling interval, and further up to the maximum interval while
+    the heater is idle (no power and standby, finished, blocked or night).
+    """
+
+    def __init__(self, minimum: float, base: float, maximum: float) -> None:
+        """Initialize the scheduler with its interval bounds in seconds."""
+        self.minimum = minimum
+        self.base = base
+        self.maximum = maximum
+        self.interval = base
+        self._last_values: dict[str, float] = {}
+
+    def set_base(self, base: float) -> None:
+        """Change the interval used while the device is active but steady."""
+        self.base = base
+        self.interval = min(self.interval, base)
+
+    def next_interval(self, data: dict, model: str | None) -> float:
+        """Return the interval until the next poll after receiving data."""
+        values = {
+            key: float(data[key])
+            for key in ADAPTIVE_SIGNALS
+            if isinstance(data.get(key), int | float)
+        }
+        fast = any(
+            abs(value - self._last_values[key]) >= ADAPTIVE_CHANGE_THRESHOLD
+            for key, value in values.items()
+            if key in self._last_values
+        )
+        self._last_values = values
+
+        if fast:
+            self.interval = self.minimum
+        elif self._is_idle(data, model):
+            self.interval = min(max(self.interval, self.minimum) * 2, self.maximum)
+        else:
+            self.interval = min(max(self.interval, self.minimum) * 2, self.base)
+        return self.interval
+
+    @staticmethod
+    def _is_idle(data: dict, model: str | None) -> bool:
+        """Return True if the heater is neither heating nor about to."""
+        if data.get("power"):
+            return False
+        if data.get("act_night_flag"):
+            return True
+        return data.get("status") in IDLE_STATES.get(MYPV_DEVICES.get(model), ())
@@ -0,0 +1,204 @@
+"""Incrementally maintained min/mean/max rollups of MYPV device samples."""
+
+from array import array
+import base64
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 600
+
+# statistic: value of an empty bucket
+_STATISTICS = {"min": math.inf, "max": -math.inf, "sum": 0.0, "count": 0.0}
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store of the rollups of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.rollups.{entry_id}")
+
+
+async def async_remove_rollups(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the persisted rollups of a config entry."""
+    await _store(hass, entry_id).async_remove()
+
+
+class RollupTier:
+    """Ring of fixed-length buckets holding min, max, sum and count per key."""
+
+    def __init__(self, step: float, size: int, keys: tuple[str, ...]) -> None:
+        """Initialize size empty buckets of step seconds."""
+        self.step = step
+        self.size = size
+        self.keys = keys
+        self.times = array("d", [math.nan]) * size
+        self.columns = {
+            (key, statistic): array("d", [empty]) * size
+            for key in keys
+            for statistic, empty in _STATISTICS.items()
+        }
+        self._head = size - 1
+
+    def _reset(self, index: int, bucket: float) -> None:
+        self.times[index] = bucket
+        for (_, statistic), column in self.columns.items():
+            column[index] = _STATISTICS[statistic]
+
+    def add(self, time: float, values: dict[str, float]) -> bool:
+        """Add a sample and return True if it started a new bucket."""
+        bucket = time // self.step * self.step
+        head = self._head
+        current = self.times[head]
+        started = math.isnan(current) or bucket > current
+        if started:
+            head = self._head = (head + 1) % self.size
+            self._reset(head, bucket)
+        elif bucket < current:
+            # the clock went backwards, the sample belongs to a closed bucket
+            return False
+        for key in self.keys:
+            value = values.get(key)
+            if value is None or math.isnan(value):
+                continue
+            columns = self.columns
+            columns[key, "min"][head] = min(columns[key, "min"][head], value)
+            columns[key, "max"][head] = max(columns[key, "max"][head], value)
+            columns[key, "sum"][head] += value
+            columns[key, "count"][head] += 1
+        return started
+
+    def aggregate(
+        self,
+        keys: tuple[str, ...],
+        start: float | None,
+        end: float | None,
+        resolution: float,
+    ) -> dict[str, Any]:
+        """Return the min, mean and max of the keys per resolution seconds.
+
+        The buckets of the tier are merged into buckets aligned to multiples
+        of resolution, a bucket without a value of a key reports None for it.
+        """
+        groups: list[float] = []
+        merged = {key: [] for key in keys}
+        for offset in range(1, self.size + 1):
+            index = (self._head + offset) % self.size
+            bucket = self.times[index]
+            if math.isnan(bucket):
+                continue
+            if (start is not None and bucket + self.step <= start) or (
+                end is not None and bucket > end
+            ):
+                continue
+            group = bucket // resolution * resolution
+            if not groups or groups[-1] != group:
+                groups.append(group)
+                for key in keys:
+                    merged[key].append([math.inf, -math.inf, 0.0, 0.0])
+            for key in keys:
+                statistics = merged[key][-1]
+                statistics[0] = min(statistics[0], self.columns[key, "min"][index])
+                statistics[1] = max(statistics[1], self.columns[key, "max"][index])
+                statistics[2] += self.columns[key, "sum"][index]
+                statistics[3] += self.columns[key, "count"][index]
+
+        result: dict[str, Any] = {"time": groups}
+        for key in keys:
+            result[key] = {
+                "min": [
+                    minimum if count else None for minimum, _, _, count in merged[key]
+                ],
+                "mean": [
+                    total / count if count else None
+                    for _, _, total, count in merged[key]
+                ],
+                "max": [
+                    maximum if count else None for _, maximum, _, count in merged[key]
+                ],
+            }
+        return result
+
+    def as_dict(self) -> dict:
+        """Return the tier as a storable dict, arrays are base64 encoded."""
+        return {
+            "step": self.step,
+            "head": self._head,
+            "times": base64.b64encode(self.times.tobytes()).decode(),
+            "columns": {
+                f"{key}:{statistic}": base64.b64encode(column.tobytes()).decode()
+                for (key, statistic), column in self.columns.items()
+            },
+        }
+
+    def restore(self, stored: dict) -> None:
+        """Restore the buckets of a stored tier of the same size."""
+        times = array("d", base64.b64decode(stored["times"]))
+        if stored["step"] != self.step or len(times) != self.size:
+            return
+        self.times = times
+        self._head = stored["head"]
+        for (key, statistic), column in self.columns.items():
+            # the buckets of a key added since stay empty
+            if (data := stored["columns"].get(f"{key}:{statistic}")) is not None:
+                column[:] = array("d", base64.b64decode(data))
+
+
+class SampleRollups:
+    """Keep a pyramid of rollup tiers up to date as samples arrive.
+
+    Every sample updates the current bucket of each tier, so aggregates over
+    any range are read from a bounded number of buckets instead of the raw
+    samples. The tiers are persisted and survive restarts.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        keys: tuple[str, ...],
+        tiers: tuple[tuple[float, int], ...],
+    ) -> None:
+        """Initialize the tiers given as (bucket seconds, bucket count)."""
+        self.keys = tuple(keys)
+        self.tiers = [RollupTier(step, size, self.keys) for step, size in tiers]
+        self._store = _store(hass, entry_id)
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load the persisted tiers."""
+        if stored := await self._store.async_load():
+            for tier, stored_tier in zip(self.tiers, stored.get("tiers", ())):
+                tier.restore(stored_tier)
+
+    async def async_save(self) -> None:
+        """Persist the tiers now."""
+        await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict:
+        self._save_scheduled = False
+        return {"tiers": [tier.as_dict() for tier in self.tiers]}
+
+    def add(self, time: float, values: dict[str, float]) -> None:
+        """Add a sample to every tier."""
+        if self.tiers[0].add(time, values) and not self._save_scheduled:
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        for tier in self.tiers[1:]:
+            tier.add(time, values)
+
+    def tier(self, resolution: float) -> RollupTier | None:
+        """Return the coarsest tier whose buckets divide resolution.
+
+        Only then every bucket falls into a single group of the resolution.
+        """
+        tiers = [tier for tier in self.tiers if resolution % tier.step == 0]
+        return max(tiers, key=lambda tier: tier.step, default=None)
+
+    @property
+    def finest_step(self) -> float:
+        """Return the bucket length of the finest tier."""
+        return min(tier.step for tier in self.tiers)
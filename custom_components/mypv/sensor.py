@@ -1,6 +1,7 @@
 """The MYPV integration."""
 
 import logging
+from time import monotonic
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -9,20 +10,35 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     CONF_MONITORED_CONDITIONS,
-    UnitOfElectricCurrent,
-    UnitOfFrequency,
-    UnitOfTemperature,
+    EntityCategory,
+    UnitOfApparentPower,
+    UnitOfPower,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DATA_COORDINATOR, DOMAIN, MYPV_DEVICES, SENSOR_TYPES
+from .const import (
+    DATA_COORDINATOR,
+    DEFAULT_MAX_PUBLISH_AGE,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DOMAIN,
+    SENSOR_TYPES,
+    UPDATE_LIVE,
+)
 from .coordinator import MYPVDataUpdateCoordinator
-from .trans import my_pv_trans
+from .deadband import Deadband
+from .values import enum_options, enum_translation_key
 
 _LOGGER = logging.getLogger(__name__)
 
+# unit: device class of the derived sensors
+_DERIVED_DEVICE_CLASSES = {
+    UnitOfApparentPower.VOLT_AMPERE: SensorDeviceClass.APPARENT_POWER,
+    UnitOfPower.WATT: SensorDeviceClass.POWER,
+}
+
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
     """Add a MYPV entry."""
@@ -36,23 +52,33 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
     ):
         coordinator.set_interval(entry.options["polling_interval"])
 
+    publish_limits = None
+    if entry.options.get("deadband_filter"):
+        publish_limits = (
+            entry.options.get("min_publish_interval", DEFAULT_MIN_PUBLISH_INTERVAL),
+            entry.options.get("max_publish_age", DEFAULT_MAX_PUBLISH_AGE),
+        )
+
     entities = []
 
     if entry.options.get("use_all_sensors"):
         entities.extend(
-            [MypvDevice(coordinator, sensor, entry.title) for sensor in SENSOR_TYPES]
+            [
+                MypvDevice(coordinator, sensor, entry.title, publish_limits)
+                for sensor in SENSOR_TYPES
+            ]
         )
     elif CONF_MONITORED_CONDITIONS in entry.options:
         entities.extend(
             [
-                MypvDevice(coordinator, sensor, entry.title)
+                MypvDevice(coordinator, sensor, entry.title, publish_limits)
                 for sensor in entry.options[CONF_MONITORED_CONDITIONS]
             ]
         )
     else:
         entities.extend(
             [
-                MypvDevice(coordinator, sensor, entry.title)
+                MypvDevice(coordinator, sensor, entry.title, publish_limits)
                 for sensor in entry.data[CONF_MONITORED_CONDITIONS]
             ]
         )
@@ -62,24 +88,38 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
 class MypvDevice(CoordinatorEntity, SensorEntity):
     """Representation of a MYPV device."""
 
-    def __init__(self, coordinator, sensor_type, name) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
+    def __init__(self, coordinator, sensor_type, name, publish_limits=None) -> None:
+        """Initialize the sensor.
+
+        publish_limits is the (min interval, max age) of the deadband filter
+        in seconds, None disables the filter.
+        """
         if sensor_type not in SENSOR_TYPES:
             raise KeyError
+        super().__init__(coordinator, (SENSOR_TYPES[sensor_type].source, sensor_type))
         self.coordinator = coordinator
 
         self._sensor = SENSOR_TYPES[sensor_type].name_long
         self._name = name
         self.type = sensor_type
         self._data_source = SENSOR_TYPES[sensor_type].source
-        self._last_value = None
         self._unit_of_measurement = SENSOR_TYPES[self.type].unit
         self._icon = SENSOR_TYPES[self.type].icon
+        if SENSOR_TYPES[self.type].update != UPDATE_LIVE:
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._deadband = None
+        self._unsub_publish: CALLBACK_TYPE | None = None
+        description = SENSOR_TYPES[self.type]
+        if publish_limits and (description.deadband or description.deadband_rel):
+            self._deadband = Deadband(
+                description.deadband, description.deadband_rel, *publish_limits
+            )
 
         self.serial_number = self.coordinator.data["info"]["sn"]
         self.fwversion = self.coordinator.data["info"]["fwversion"]
         self.model = self.coordinator.data["info"]["device"]
+        self._attr_translation_key = enum_translation_key(self.type, self.model)
+        self._options = enum_options(self.type, self.model)
         _LOGGER.debug(self.coordinator)
 
     @property
@@ -102,53 +142,54 @@ class MypvDevice(CoordinatorEntity, SensorEntity):
     @property
     def state(self):
         """Return the state of the device."""
-        state = None
-        try:
-            state = self.coordinator.data[self._data_source][self.type]
-            if self.type == "power_act":
-                rel_out = int(self.coordinator.data[self._data_source]["rel1_out"])
-                load_nom = int(self.coordinator.data[self._data_source]["load_nom"])
-                state = (rel_out * load_nom) + int(state)
-            self._last_value = state
-        except KeyError:
-            _LOGGER.exception(
-                "State not found on device. You should remove it from the configuration"
+        if self._deadband is None:
+            return self.coordinator.value(self.type)
+        if not self._deadband.published:
+            self._deadband.publish(self.coordinator.value(self.type), monotonic())
+        return self._deadband.value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state unless the deadband filter holds it back."""
+        if self._deadband is None:
+            self.async_write_ha_state()
+            return
+        now = monotonic()
+        value = self.coordinator.value(self.type)
+        self._cancel_publish()
+        if self._deadband.accept(value, now):
+            self.async_write_ha_state()
+        else:
+            # the latest held back value decides when it is due
+            self._unsub_publish = async_call_later(
+                self.hass, self._deadband.due_in(value, now), self._async_publish
             )
-        except Exception as ex:
-            _LOGGER.error(ex)
-            state = self._last_value
-        if state is None:
-            return state
-        if self._unit_of_measurement == UnitOfFrequency.HERTZ:
-            return state / 1000
-        if (
-            self._unit_of_measurement == UnitOfTemperature.CELSIUS
-            and self.type != "tempchip"
-        ):
-            return state / 10
-        if self._unit_of_measurement == UnitOfElectricCurrent.AMPERE:
-            return state / 10
-        trans_key = f"info_{self.type}_{state!s}"
-        if self.type == "status":
-            trans_key = f"info_state_{MYPV_DEVICES[self.model]}_{state!s}"
-        elif self.type in ["m1devstate", "m2devstate", "m3devstate", "m4devstate"]:
-            if state & 1:
-                trans_key = "info_measure_devstate_err1"
-            elif state & 2:
-                trans_key = "info_measure_devstate_err2"
-            elif state & 4:
-                trans_key = "info_measure_devstate_err3"
-            elif state & 8:
-                trans_key = "info_measure_devstate_err4"
-            else:
-                return state
-        if trans_key in my_pv_trans:
-            return str(state) + my_pv_trans[trans_key][0]  # 0 = deutsch
-        return state
+
+    @callback
+    def _async_publish(self, _now) -> None:
+        """Publish a held back value once it is due."""
+        self._unsub_publish = None
+        self._deadband.publish(self.coordinator.value(self.type), monotonic())
+        self.async_write_ha_state()
+
+    @callback
+    def _cancel_publish(self) -> None:
+        """Cancel a pending publish of a held back value."""
+        if self._unsub_publish is not None:
+            self._unsub_publish()
+            self._unsub_publish = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending publish when the entity is removed."""
+        self._cancel_publish()
 
     @property
     def state_class(self):
         """State class."""
+        if self._data_source == "energy":
+            return SensorStateClass.TOTAL_INCREASING
+        if self._data_source == "derived":
+            return SensorStateClass.MEASUREMENT
         if self.type == "power":
             return SensorStateClass.MEASUREMENT
         if self.type == "temp1":
@@ -158,12 +199,23 @@ class MypvDevice(CoordinatorEntity, SensorEntity):
     @property
     def device_class(self):
         """State class."""
+        if self._options is not None:
+            return SensorDeviceClass.ENUM
+        if self._data_source == "energy":
+            return SensorDeviceClass.ENERGY
+        if self._data_source == "derived":
+            return _DERIVED_DEVICE_CLASSES.get(self._unit_of_measurement)
         if self.type == "power":
             return SensorDeviceClass.POWER
         if self.type == "temp1":
             return SensorDeviceClass.TEMPERATURE
         return None
 
+    @property
+    def options(self):
+        """Return the possible states of an enum sensor."""
+        return self._options
+
     @property
     def native_unit_of_measurement(self):
         """Return the unit of measurement this sensor expresses itself in."""
@@ -0,0 +1,172 @@
+"""Services of the MYPV integration."""
+
+import voluptuous as vol
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util.dt import as_timestamp
+
+from .const import DATA_COORDINATOR, DOMAIN, SERVICE_PARAMETERS
+from .coordinator import MYPVDataUpdateCoordinator
+from .history import downsample
+
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_GET_AGGREGATES = "get_aggregates"
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_HOST): cv.string,
+        vol.Optional("keys"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("step"): vol.All(vol.Coerce(float), vol.Range(min=1)),
+        vol.Optional("stored", default=False): cv.boolean,
+    }
+)
+
+GET_AGGREGATES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_HOST): cv.string,
+        vol.Optional("keys"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Required("resolution"): vol.All(vol.Coerce(float), vol.Range(min=1)),
+    }
+)
+
+# service: field holding the value of its setup parameter
+SERVICE_FIELDS = {
+    "set_max_power": "max_current",
+    "switch_boost": "absolute_max_current",
+    "set_control_target": "control_target",
+}
+
+
+def _coordinators(
+    hass: HomeAssistant, host: str | None
+) -> list[MYPVDataUpdateCoordinator]:
+    """Return the coordinators of the loaded devices, optionally of one host.
+
+    ServiceValidationError is raised if no loaded device has the host.
+    """
+    coordinators = [
+        entry_data[DATA_COORDINATOR]
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+    ]
+    if host is None:
+        return coordinators
+    matching = [coordinator for coordinator in coordinators if coordinator.host == host]
+    if not matching:
+        raise ServiceValidationError(f"No MYPV device loaded with host {host}")
+    return matching
+
+
+def _time_range(call: ServiceCall) -> tuple[float | None, float | None]:
+    """Return the start and end timestamps of a query, None if open."""
+    start = as_timestamp(call.data["start"]) if "start" in call.data else None
+    end = as_timestamp(call.data["end"]) if "end" in call.data else None
+    return start, end
+
+
+def _keys(call: ServiceCall, available: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the requested keys which are available, all if none requested."""
+    return tuple(key for key in call.data.get("keys", available) if key in available)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def get_history(call: ServiceCall) -> ServiceResponse:
+        """Return samples from the in-memory buffers or archives of the devices.
+
+        Without step the raw samples are returned, with step their min, mean
+        and max per step seconds.
+        """
+        start, end = _time_range(call)
+        response = {}
+        for coordinator in _coordinators(hass, call.data.get(CONF_HOST)):
+            history = coordinator.history
+            keys = _keys(call, history.keys)
+            if not call.data["stored"]:
+                samples = history.window(keys, start, end)
+            elif coordinator.archive is not None:
+                samples = await coordinator.archive.async_window(keys, start, end)
+            else:
+                continue
+            if "step" in call.data:
+                samples = downsample(samples, call.data["step"])
+            response[coordinator.host] = samples
+        return response
+
+    @callback
+    def get_aggregates(call: ServiceCall) -> ServiceResponse:
+        """Return the min, mean and max of the devices per resolution seconds.
+
+        The aggregates are merged from the coarsest rollup tier whose buckets
+        divide the resolution, resolutions finer than every tier are computed
+        from the samples in memory.
+        """
+        start, end = _time_range(call)
+        resolution = call.data["resolution"]
+        response = {}
+        for coordinator in _coordinators(hass, call.data.get(CONF_HOST)):
+            keys = _keys(call, coordinator.history.keys)
+            rollups = coordinator.rollups
+            tier = rollups.tier(resolution)
+            if tier is None and resolution >= rollups.finest_step:
+                raise ServiceValidationError(
+                    f"Resolution must be a multiple of {rollups.finest_step:g} seconds"
+                )
+            if tier is not None:
+                response[coordinator.host] = tier.aggregate(
+                    keys, start, end, resolution
+                )
+            else:
+                response[coordinator.host] = coordinator.history.downsample(
+                    keys, start, end, resolution
+                )
+        return response
+
+    @callback
+    def set_parameter(call: ServiceCall) -> None:
+        """Write the setup parameter of the service, debounced per device."""
+        parameter = SERVICE_PARAMETERS[call.service]
+        value = call.data[SERVICE_FIELDS[call.service]]
+        for coordinator in _coordinators(hass, call.data.get(CONF_HOST)):
+            coordinator.writer.async_set({parameter: value})
+
+    for service, field in SERVICE_FIELDS.items():
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            set_parameter,
+            schema=vol.Schema(
+                {
+                    vol.Optional(CONF_HOST): cv.string,
+                    vol.Required(field): vol.Coerce(int),
+                }
+            ),
+        )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_AGGREGATES,
+        get_aggregates,
+        schema=GET_AGGREGATES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
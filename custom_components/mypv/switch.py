@@ -1,17 +1,22 @@
 """Switch for mypv."""
 
-import json
 import logging
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DATA_COORDINATOR, DOMAIN, MYPV_SWITCHES, SENSOR_TYPES
+from .const import (
+    DATA_COORDINATOR,
+    DOMAIN,
+    MYPV_SWITCHES,
+    SENSOR_TYPES,
+    WRITE_CONFIRM_TIMEOUT,
+)
 from .coordinator import MYPVDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,7 +43,11 @@ async def async_setup_entry(
     coordinator: MYPVDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
         DATA_COORDINATOR
     ]
-    entities = [MYPVSwitch(coordinator, switch_name) for switch_name in MYPV_SWITCHES]
+    optimistic = entry.options.get("optimistic_switches", False)
+    entities = [
+        MYPVSwitch(coordinator, switch_name, optimistic)
+        for switch_name in MYPV_SWITCHES
+    ]
     async_add_entities(entities)
 
 
@@ -50,17 +59,21 @@ class MYPVSwitch(CoordinatorEntity, SwitchEntity):
     """
 
     def __init__(
-        self, coordinator: MYPVDataUpdateCoordinator, switch_name: str
+        self,
+        coordinator: MYPVDataUpdateCoordinator,
+        switch_name: str,
+        optimistic: bool = False,
     ) -> None:
         """Initialize the switch entity.
 
         Args:
             coordinator: The data update coordinator instance.
             switch_name: the identifier in SENSOR_TYPES
+            optimistic: publish the target state before the device confirms it
         """
-        super().__init__(coordinator)
         if switch_name not in SENSOR_TYPES:
             raise KeyError
+        super().__init__(coordinator, ("setup", switch_name))
         self.coordinator = coordinator
 
         self._icon = SENSOR_TYPES[switch_name].icon
@@ -90,6 +103,11 @@ class MYPVSwitch(CoordinatorEntity, SwitchEntity):
 
         # Internal state variables
         self._state = None
+        self._optimistic = optimistic
+        # target state published while a write is unconfirmed
+        self._target: bool | None = None
+        # identifies the write owning the published target state
+        self._target_write: object | None = None
         # self._register = definition["register"]
 
         # Optional: disable entity by default if specified in the definition
@@ -120,6 +138,8 @@ class MYPVSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if switch sensor is on, False if off, None if unknown."""
+        if self._target is not None:
+            return self._target
         data = self.coordinator.data["setup"]
         if data is None or self._key not in data:
             return None
@@ -129,27 +149,44 @@ class MYPVSwitch(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on via the coordinator."""
-
-        # Write the value using the coordinator's async HTTP session
-        session = async_get_clientsession(self.hass)
-        async with session.get(
-            f"http://{self.coordinator.host}/setup.jsn?{self.type}={self.on_value}"
-        ) as resp:
-            response_text = await resp.read()
-            json_data = json.loads(response_text)
-            self.coordinator.data["setup"][self.type] = json_data[self.type]
+        await self._async_write(self.on_value)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the switch off via the coordinator."""
+        await self._async_write(0)
 
-        # Write the value using the coordinator's method
-        session = async_get_clientsession(self.hass)
-        async with session.get(
-            f"http://{self.coordinator.host}/setup.jsn?{self.type}=0"
-        ) as resp:
-            response_text = await resp.read()
-            json_data = json.loads(response_text)
-            self.coordinator.data["setup"][self.type] = json_data[self.type]
+    async def _async_write(self, value: int) -> None:
+        """Write the switch value together with other pending changes.
+
+        The confirmed setup page is applied to the coordinator, which
+        notifies the entities of the changed values. In optimistic mode the
+        target state is published at once and rolled back if the write fails
+        or was not sent within WRITE_CONFIRM_TIMEOUT, the value is withdrawn
+        then.
+        """
+        writer = self.coordinator.writer
+        if not self._optimistic:
+            await writer.async_write({self.type: value})
+            return
+
+        self._target = value == self.on_value
+        write = self._target_write = object()
+        self.async_write_ha_state()
+        try:
+            await writer.async_write({self.type: value}, WRITE_CONFIRM_TIMEOUT)
+        except TimeoutError as error:
+            writer.statistics.rollbacks += 1
+            raise HomeAssistantError(
+                f"Device did not confirm {self.type} in time"
+            ) from error
+        except HomeAssistantError:
+            writer.statistics.rollbacks += 1
+            raise
+        finally:
+            # a later write owns the published target state
+            if self._target_write is write:
+                self._target = self._target_write = None
+                self.async_write_ha_state()
 
     async def async_update(self):
         """Return sensor state."""
@@ -0,0 +1,144 @@
+"""Conversion of raw MYPV device values into sensor states."""
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.const import (
+    UnitOfElectricCurrent,
+    UnitOfFrequency,
+    UnitOfTemperature,
+)
+
+from .const import ENUM_CODES, MYPV_DEVICES, SENSOR_TYPES, STATUS_CODES
+
+DEVSTATE_SENSORS = ("m1devstate", "m2devstate", "m3devstate", "m4devstate")
+
+# devstate bit: state, the lowest set bit wins
+DEVSTATE_ERRORS = ((1, "err1"), (2, "err2"), (4, "err3"), (8, "err4"))
+DEVSTATE_OK = "ok"
+
+# devstate codes with a precomputed state, larger codes are rare
+DEVSTATE_INDEX_SIZE = 256
+
+Converter = Callable[[dict], Any]
+
+
+def _divisor(sensor_type: str) -> int:
+    """Return the divisor scaling the raw value to the unit of the sensor."""
+    unit = SENSOR_TYPES[sensor_type].unit
+    if unit == UnitOfFrequency.HERTZ:
+        return 1000
+    if unit == UnitOfTemperature.CELSIUS and sensor_type != "tempchip":
+        return 10
+    if unit == UnitOfElectricCurrent.AMPERE:
+        return 10
+    return 1
+
+
+def _raw_getter(sensor_type: str) -> Converter:
+    """Return a function reading the raw value of the sensor from its page."""
+    if sensor_type == "power_act":
+
+        def power_act(page: dict) -> Any:
+            rel_out = int(page["rel1_out"])
+            load_nom = int(page["load_nom"])
+            return (rel_out * load_nom) + int(page["power_act"])
+
+        return power_act
+
+    def raw(page: dict) -> Any:
+        return page[sensor_type]
+
+    return raw
+
+
+def _devstate_option(state: int) -> str:
+    """Return the enum state of a devstate bit field."""
+    for bit, option in DEVSTATE_ERRORS:
+        if state & bit:
+            return option
+    return DEVSTATE_OK
+
+
+def enum_translation_key(sensor_type: str, model: str | None) -> str | None:
+    """Return the translation key of an enum sensor.
+
+    None is returned for sensors without a fixed set of states.
+    """
+    if sensor_type in DEVSTATE_SENSORS:
+        return "devstate"
+    if sensor_type == "status":
+        if (short := MYPV_DEVICES.get(model)) in STATUS_CODES:
+            return f"status_{short}"
+        return None
+    if sensor_type in ENUM_CODES:
+        return sensor_type
+    return None
+
+
+def enum_options(sensor_type: str, model: str | None) -> list[str] | None:
+    """Return the states of an enum sensor, None if it is no enum sensor."""
+    if sensor_type in DEVSTATE_SENSORS:
+        return [DEVSTATE_OK, *(option for _, option in DEVSTATE_ERRORS)]
+    if sensor_type == "status":
+        codes = STATUS_CODES.get(MYPV_DEVICES.get(model))
+    else:
+        codes = ENUM_CODES.get(sensor_type)
+    if codes is None:
+        return None
+    return [str(code) for code in codes]
+
+
+def build_state_index(sensor_type: str, model: str | None) -> dict[Any, str]:
+    """Map every raw code of an enum sensor to its state."""
+    if sensor_type in DEVSTATE_SENSORS:
+        return {state: _devstate_option(state) for state in range(DEVSTATE_INDEX_SIZE)}
+    index: dict[Any, str] = {}
+    for option in enum_options(sensor_type, model) or ():
+        # the device sends numbers, accept their string form as well
+        index[int(option)] = index[option] = option
+    return index
+
+
+def compile_converter(sensor_type: str, model: str | None) -> Converter:
+    """Return the function converting a page into the state of the sensor."""
+    raw = _raw_getter(sensor_type)
+
+    if (divisor := _divisor(sensor_type)) != 1:
+
+        def scaled(page: dict) -> Any:
+            state = raw(page)
+            return None if state is None else state / divisor
+
+        return scaled
+
+    if enum_translation_key(sensor_type, model) is None:
+        return raw
+
+    index = build_state_index(sensor_type, model)
+
+    if sensor_type in DEVSTATE_SENSORS:
+
+        def devstate(page: dict) -> Any:
+            state = raw(page)
+            if state is None:
+                return None
+            if (option := index.get(state)) is None:
+                option = _devstate_option(state)
+            return option
+
+        return devstate
+
+    def enum(page: dict) -> Any:
+        # codes outside of the known states are reported as unknown
+        return index.get(raw(page))
+
+    return enum
+
+
+def compile_converters(model: str | None) -> dict[str, Converter]:
+    """Return the converters of all sensors for a device model."""
+    return {
+        sensor_type: compile_converter(sensor_type, model)
+        for sensor_type in SENSOR_TYPES
+    }
@@ -0,0 +1,223 @@
+"""Batched writes of setup.jsn parameters of a MYPV device."""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import json
+import logging
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .connection import MYPVConnectionPool
+from .const import DOMAIN, WRITE_COALESCE_WINDOW, WRITE_DEBOUNCE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteStatistics:
+    """Outcome of the writes and their time to a confirmed state."""
+
+    requests: int = 0
+    # debounced values not sent as they equal the confirmed ones
+    dropped: int = 0
+    # debounced values replaced by a later value before being sent
+    superseded: int = 0
+    confirmed: int = 0
+    rejected: int = 0
+    failed: int = 0
+    # optimistic states rolled back after a failed or unconfirmed write
+    rollbacks: int = 0
+    # seconds from a write call to the confirming setup page
+    last_latency: float = 0.0
+    mean_latency: float = 0.0
+    max_latency: float = 0.0
+
+    def add_latency(self, latency: float) -> None:
+        """Count a confirmed write and its latency."""
+        self.confirmed += 1
+        self.last_latency = latency
+        self.mean_latency += (latency - self.mean_latency) / self.confirmed
+        self.max_latency = max(self.max_latency, latency)
+
+
+class SetupWriter:
+    """Coalesce parameter changes into single setup.jsn requests.
+
+    Changes arriving within WRITE_COALESCE_WINDOW of the first one are sent
+    together as one request, a later value of a parameter replacing an
+    earlier one. Requests hold the command channel of the device, so they
+    never interleave with the reads of a refresh. The setup page the device
+    answers, read again if the answer lacks a written parameter, is handed
+    to apply and confirms the written values; every caller receives it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        pool: MYPVConnectionPool,
+        channel: asyncio.Lock,
+        apply: Callable[[bytes], dict],
+        confirmed: Callable[[], dict],
+    ) -> None:
+        """Initialize the writer of a device.
+
+        apply stores a setup page the device answered and returns it parsed,
+        confirmed returns the last confirmed setup page if it is recent
+        enough to drop values equal to it, else an empty dict.
+        """
+        self.hass = hass
+        self.pool = pool
+        self.channel = channel
+        self._apply = apply
+        self._confirmed = confirmed
+        self._debounced: dict[str, Any] = {}
+        self._debounce: asyncio.Task | None = None
+        self._pending: dict[str, Any] = {}
+        # values, time of the call, future of every waiting caller
+        self._waiters: list[tuple[dict[str, Any], float, asyncio.Future]] = []
+        self._flush: asyncio.Task | None = None
+        self.statistics = WriteStatistics()
+
+    async def async_write(
+        self, values: dict[str, Any], timeout: float | None = None
+    ) -> dict:
+        """Write parameters and return the setup page confirming them.
+
+        HomeAssistantError is raised if the request fails or the device did
+        not take over one of the values. TimeoutError is raised if the values
+        were not sent within timeout seconds, they are withdrawn then; values
+        already sent are awaited.
+        """
+        self._pending.update(values)
+        waiter = self.hass.loop.create_future()
+        waiting = (values, self.hass.loop.time(), waiter)
+        self._waiters.append(waiting)
+        if self._flush is None:
+            self._flush = self.hass.async_create_task(self._async_flush())
+        try:
+            async with asyncio.timeout(timeout):
+                return await asyncio.shield(waiter)
+        except TimeoutError:
+            if waiting not in self._waiters:
+                # the request is sent, its answer decides
+                return await waiter
+            self._withdraw(waiting)
+            raise
+
+    def _withdraw(self, waiting: tuple[dict[str, Any], float, asyncio.Future]) -> None:
+        """Remove the values of a waiting caller from the pending batch."""
+        self._waiters.remove(waiting)
+        self._pending = {}
+        for requested, _, _ in self._waiters:
+            self._pending.update(requested)
+        if not self._waiters and self._flush is not None:
+            self._flush.cancel()
+            self._flush = None
+
+    def cancel(self) -> None:
+        """Cancel the writes not sent yet, their callers receive an error."""
+        for task in (self._debounce, self._flush):
+            if task is not None:
+                task.cancel()
+        self._debounce = self._flush = None
+        self._debounced = {}
+        self._pending = {}
+        waiters, self._waiters = self._waiters, []
+        for _, _, waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(HomeAssistantError("Write cancelled on shutdown"))
+
+    def async_set(self, values: dict[str, Any]) -> None:
+        """Write parameters in the background, debounced.
+
+        Values arriving within WRITE_DEBOUNCE of the first one are sent
+        together, only the latest value of a parameter is kept, and values
+        equal to the confirmed ones are dropped.
+        """
+        confirmed = self._confirmed()
+        for key, value in values.items():
+            if key in self._debounced:
+                self.statistics.superseded += 1
+            elif str(confirmed.get(key)) == str(value):
+                self.statistics.dropped += 1
+                continue
+            self._debounced[key] = value
+        if self._debounced and self._debounce is None:
+            self._debounce = self.hass.async_create_background_task(
+                self._async_debounce(), f"{DOMAIN} debounced write {self.pool.host}"
+            )
+
+    async def _async_debounce(self) -> None:
+        """Write the debounced parameters once the debounce time is over."""
+        await asyncio.sleep(WRITE_DEBOUNCE)
+        debounced, self._debounced = self._debounced, {}
+        self._debounce = None
+        confirmed = self._confirmed()
+        values = {
+            key: value
+            for key, value in debounced.items()
+            if str(confirmed.get(key)) != str(value)
+        }
+        self.statistics.dropped += len(debounced) - len(values)
+        if not values:
+            return
+        try:
+            await self.async_write(values)
+        except HomeAssistantError as error:
+            _LOGGER.error(error)
+
+    async def _async_flush(self) -> None:
+        """Send the parameters collected within the coalescing window."""
+        await asyncio.sleep(WRITE_COALESCE_WINDOW)
+        try:
+            async with self.channel:
+                # values arriving while a poll holds the channel join the
+                # batch, and values of callers timing out are withdrawn
+                values, self._pending = self._pending, {}
+                waiters, self._waiters = self._waiters, []
+                self._flush = None
+                _LOGGER.debug("Writing setup parameters %s", values)
+                self.statistics.requests += 1
+                raw = await self.pool.async_get("setup", params=values)
+                if any(key not in json.loads(raw) for key in values):
+                    # read after write, the answer does not show all values
+                    raw = await self.pool.async_get("setup")
+                response = self._apply(raw)
+        except (aiohttp.ClientError, TimeoutError, json.JSONDecodeError) as error:
+            self.statistics.failed += 1
+            exception = HomeAssistantError(f"Failed to write {values}: {error}")
+            for _, _, waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(exception)
+            return
+
+        rejected = {
+            key for key, value in values.items() if str(response.get(key)) != str(value)
+        }
+        if rejected:
+            _LOGGER.warning(
+                "Device did not confirm %s",
+                {key: values[key] for key in rejected},
+            )
+        now = self.hass.loop.time()
+        for requested, called, waiter in waiters:
+            if waiter.done():
+                continue
+            # a value replaced by a later write of the batch is not checked
+            if failed := {
+                key
+                for key in rejected
+                if key in requested and requested[key] == values[key]
+            }:
+                self.statistics.rejected += 1
+                waiter.set_exception(
+                    HomeAssistantError(f"Device did not confirm {sorted(failed)}")
+                )
+            else:
+                self.statistics.add_latency(now - called)
+                waiter.set_result(response)
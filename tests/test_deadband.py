@@ -0,0 +1,20 @@
+"""Tests of the deadband filter."""
+
+from custom_components.mypv.deadband import Deadband
+
+
+def test_one_step_noise_is_dropped() -> None:
+    """Changes of one device step within a band of one step are held back."""
+    deadband = Deadband(0.1, 0, 0, 300)
+    assert deadband.accept(45.1, 0)
+    for time, value in enumerate((45.2, 45.0, 45.2, 45.0), 1):
+        assert not deadband.accept(value, time)
+    assert deadband.value == 45.1
+
+
+def test_two_step_change_is_published() -> None:
+    """A change of two device steps leaves a band of one step."""
+    deadband = Deadband(0.1, 0, 0, 300)
+    assert deadband.accept(45.1, 0)
+    assert deadband.accept(45.3, 1)
+    assert deadband.value == 45.3